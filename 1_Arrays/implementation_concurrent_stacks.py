@@ -0,0 +1,195 @@
+"""
+Concurrent Stack Implementation - Sharing a Stack Between Threads
+
+Pattern: Stack (LIFO) + Monitor (lock + condition variable)
+Concept: Thread-Safe Data Structures
+
+Why the Plain Stack Isn't Enough:
+- Single list.append()/list.pop() calls are atomic in CPython, but anything
+  that checks-then-acts ("if stack: stack.pop()") can interleave with
+  another thread between the check and the act
+- A consumer that wants to WAIT for an item needs a way to sleep until a
+  producer pushes - that's what a condition variable is for
+
+Design:
+- One threading.Condition guards the list (lock + wait/notify in one object)
+- push()/push_many(): take the lock, append, wake up waiting poppers
+- pop(timeout): take the lock, sleep until an item arrives or time runs out
+- try_pop(): non-blocking pop - takes the lock just long enough to pop,
+  never waits for an item to arrive
+- push_many()/pop_many(): take the lock ONCE per batch instead of once per
+  element, which is what actually matters under contention
+
+Operations Time Complexity:
+- push(), try_pop(): O(1)
+- pop(timeout): O(1) once an item is available
+- push_many(k), pop_many(k): O(k) with one lock acquisition
+
+Space Complexity: O(n) where n is number of elements in stack
+
+Note on the GIL:
+- CPython threads don't run Python bytecode in parallel, so more threads
+  won't make stack operations faster; the benchmark below shows how much
+  throughput is lost to lock handoffs as threads are added, and how
+  batching recovers it
+"""
+
+import queue
+import threading
+import time
+
+
+class ConcurrentStack:
+    """
+    A LIFO stack that can be shared safely between threads.
+
+    Same push/pop API as implementation_stacks.Stack, plus non-blocking
+    and batched operations.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty stack with its condition variable.
+        """
+        self.stack = []  # Underlying dynamic array, top = end
+        self.cond = threading.Condition()  # Lock + wait/notify for blocking pops
+
+    def push(self, n):
+        """
+        Push a value and wake one waiting popper.
+
+        Time Complexity: O(1) amortized
+        """
+        with self.cond:
+            self.stack.append(n)
+            self.cond.notify()  # No-op if nobody is waiting
+
+    def push_many(self, values):
+        """
+        Push a batch of values under a single lock acquisition.
+
+        Time Complexity: O(k)
+        """
+        values = list(values)
+        with self.cond:
+            self.stack.extend(values)
+            self.cond.notify(len(values))  # Up to k waiters can now make progress
+
+    def try_pop(self, default=None):
+        """
+        Pop the top value if there is one, without waiting for an item.
+
+        Time Complexity: O(1)
+
+        Returns:
+            The top value, or `default` if the stack is empty
+
+        Note:
+            list.pop() alone is atomic, but pop_many() reads and deletes its
+            slice in two steps - popping without the lock could slip in
+            between them, handing one item to two threads and dropping another.
+        """
+        with self.cond:
+            try:
+                return self.stack.pop()
+            except IndexError:  # Empty
+                return default
+
+    def pop(self, timeout=None):
+        """
+        Remove and return the top value, waiting for one if necessary.
+
+        Time Complexity: O(1) once an item is available
+
+        Args:
+            timeout: float or None - seconds to wait; None waits forever
+
+        Raises:
+            queue.Empty if no item arrived within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.cond:
+            while True:
+                try:
+                    return self.stack.pop()
+                except IndexError:  # Empty - wait for a push (or re-check after a stolen wakeup)
+                    pass
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self.cond.wait(remaining)
+
+    def pop_many(self, k):
+        """
+        Pop up to k values under a single lock acquisition (never waits).
+
+        Time Complexity: O(k)
+
+        Returns:
+            list of removed values in stack order (old top is last)
+        """
+        with self.cond:
+            k = min(k, len(self.stack))
+            removed = self.stack[len(self.stack) - k:]
+            del self.stack[len(self.stack) - k:]
+        return removed
+
+    def __len__(self):
+        return len(self.stack)
+
+
+def benchmark(totalOps=200_000, threadCounts=(1, 2, 4, 8, 16, 32), batch=64):
+    """
+    Measure push+pop throughput as the number of threads grows.
+
+    Each run does the same total work split evenly across threads: every
+    thread pushes its share then pops it back. Per-element calls take the
+    lock once per push; batched calls take it once per `batch` elements.
+    """
+    print(f"{'threads':>7} {'single ops/s':>14} {'batched ops/s':>14}")
+    for threads in threadCounts:
+        perThread = totalOps // threads
+        results = []
+        for batched in (False, True):
+            s = ConcurrentStack()
+            elements = (perThread // batch) * batch if batched else perThread  # Per thread, actually done
+
+            def worker():
+                if batched:
+                    for _ in range(perThread // batch):
+                        s.push_many(range(batch))
+                        s.pop_many(batch)
+                else:
+                    for i in range(perThread):
+                        s.push(i)
+                        s.pop()
+
+            workers = [threading.Thread(target=worker) for _ in range(threads)]
+            start = time.perf_counter()
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join()
+            elapsed = time.perf_counter() - start
+            results.append(2 * elements * threads / elapsed)  # push + pop per element
+        print(f"{threads:>7} {results[0]:>14,.0f} {results[1]:>14,.0f}")
+
+
+if __name__ == "__main__":
+    s = ConcurrentStack()
+    s.push(1)
+    s.push_many([2, 3])
+    print(s.pop())  # Expected: 3
+    print(s.try_pop())  # Expected: 2
+    print(s.pop_many(5))  # Expected: [1]
+    print(s.try_pop())  # Expected: None
+
+    # Blocking pop: a producer thread pushes after a short delay
+    threading.Timer(0.05, s.push, args=(42,)).start()
+    print(s.pop(timeout=1))  # Expected: 42
+    try:
+        s.pop(timeout=0.01)
+    except queue.Empty:
+        print("timed out")  # Expected: timed out
+
+    benchmark()
@@ -23,14 +23,88 @@ Operations Time Complexity:
 - get(): O(1) - direct index access
 - insert() [overwrite]: O(1) - direct index access
 - resize(): O(n) - must copy all n elements
+- extend() / extend_from_buffer(): O(k) for k new elements, at most one resize
+- pop_many() / truncate(): O(1) length update (pop_many also copies out k values)
 
 Space Complexity: O(n) where n is capacity (may be up to 2x length)
 
 This vs Static Array:
 - Static: Fixed size, faster, no resize overhead, but inflexible
 - Dynamic: Flexible size, slight overhead, more practical for most uses
+
+Typed Storage Mode (Array(typecode='q')):
+- A plain Python list stores pointers to boxed int objects (~28 bytes per
+  int object + 8 bytes per pointer)
+- array.array stores raw machine values back to back (8 bytes per 'q'/'d')
+- Same operations and complexities, just a more compact buffer underneath
+- Supports the buffer protocol, so the data can be handed off to other code
+  (memoryview, NumPy, file writes) without copying
+
+Growth Policies (Array(growth=...)):
+- 'double': capacity * 2 (the classic textbook choice, default)
+- '1.5x': capacity * 1.5 (less wasted space, slightly more resizes)
+- 'cpython': n + n/8 + 6, rounded to a multiple of 4 (what list.append does)
+- 'chunk': capacity + fixed chunk (linear growth, O(n²) total copying - only
+  sensible when the final size is known to be small or is reserved up front)
+- Any callable f(capacity, minCapacity) -> newCapacity can be plugged in
+- reserve(n) / Array(capacity=n) pre-size the array so bulk loads never resize
+
+Shrinking (Array(shrink=True)):
+- By default popback never gives memory back (peak allocation is kept)
+- With shrink=True, capacity is halved once length falls to capacity / 4
+- Why /4 and not /2: hysteresis. Shrinking at /2 means a push right after a
+  shrink forces a grow, so alternating push/pop at the boundary would cost
+  O(n) every call. At /4 the array is half full after shrinking, so Θ(n)
+  operations must happen before the next resize - still amortized O(1)
+- shrink_to_fit() releases all unused capacity on demand
+- allocated_bytes() / used_bytes() report the backing store's footprint
+
+File-Backed Mode (MappedArray):
+- Same typed buffer, but it lives in a file that is mmap-ed into memory
+- The OS pages data in lazily, so reopening a huge array is O(1) - nothing is
+  read or parsed up front, and startup cost doesn't depend on data size
+- Growing = extending the file and re-mapping it (the old bytes stay put on
+  disk, so unlike a normal resize nothing has to be copied)
+- readonly=True maps with ACCESS_READ: many processes can open the same file
+  and share the same physical pages (zero copy)
 """
 
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+
+def growDouble(capacity, minCapacity):
+    """Classic doubling: amortized O(1) pushback, up to 50% wasted space."""
+    return max(2 * capacity, minCapacity)
+
+
+def growOneAndHalf(capacity, minCapacity):
+    """1.5x growth (used by MSVC std::vector, Java ArrayList)."""
+    return max(capacity + (capacity >> 1), minCapacity)
+
+
+def growCPython(capacity, minCapacity):
+    """CPython list over-allocation: ~12.5% headroom plus a small constant."""
+    return max((minCapacity + (minCapacity >> 3) + 6) & ~3, minCapacity)
+
+
+def growChunk(chunk=1024):
+    """Build a fixed-chunk policy that adds `chunk` slots per resize."""
+    def grow(capacity, minCapacity):
+        return max(capacity + chunk, minCapacity)
+    return grow
+
+
+GROWTH_POLICIES = {
+    'double': growDouble,
+    '1.5x': growOneAndHalf,
+    'cpython': growCPython,
+    'chunk': growChunk(),
+}
+
 
 class Array:
     """
@@ -40,16 +114,45 @@ class Array:
     how dynamic arrays grow to accommodate new elements.
     """
     
-    def __init__(self):
+    def __init__(self, typecode=None, capacity=2, growth='double', shrink=False):
         """
         Initialize a dynamic array with initial capacity of 2.
         
         Starting small to demonstrate the resizing mechanism.
         In practice, implementations often start with capacity 8-16.
+        
+        Args:
+            typecode: str or None - if given (e.g. 'q' for 64-bit ints,
+                'd' for doubles), store values unboxed in an array.array
+                with this typecode instead of a Python list
+            capacity: int - initial number of allocated slots (default 2)
+            growth: str or callable - a key of GROWTH_POLICIES, or a function
+                f(capacity, minCapacity) returning the new capacity
+            shrink: bool - halve capacity when length drops to capacity / 4
         """
-        self.capacity = 2  # Total allocated space
+        self.typecode = typecode  # None = plain list, otherwise array.array typecode
+        self.growth = GROWTH_POLICIES[growth] if isinstance(growth, str) else growth
+        self.shrink = shrink  # Give memory back as the array empties
+        self.capacity = capacity  # Total allocated space
         self.length = 0  # Number of elements currently stored
-        self.arr = [0] * 2  # Array of capacity = 2, initialized with zeros
+        self.arr = self.allocate(capacity)  # Array of given capacity, initialized with zeros
+
+    def allocate(self, capacity):
+        """
+        Allocate a zero-filled backing store with the given capacity.
+        
+        Time Complexity: O(n) - must zero-fill n slots
+        Space Complexity: O(n)
+        
+        Args:
+            capacity: int - number of slots to allocate
+            
+        Returns:
+            list of zeros, or array.array of zeros in typed mode
+        """
+        if self.typecode is None:  # Plain mode: list of (boxed) ints
+            return [0] * capacity
+        return array(self.typecode, bytes(capacity * array(self.typecode).itemsize))  # Zeroed raw memory
 
     def pushback(self, n):
         """
@@ -72,37 +175,60 @@ class Array:
             the amortized cost per insertion is O(1).
         """
         if self.length == self.capacity:  # Array is full, need more space
-            self.resize()  # Double the capacity
+            self.resize()  # Grow the capacity (doubles by default)
             
         # insert at next empty position
         self.arr[self.length] = n  # Place element at end
         self.length += 1  # Increment count of elements
 
-    def resize(self):
+    def resize(self, newCapacity=None):
         """
-        Double the array's capacity by creating a new larger array.
+        Grow the array's capacity by creating a new larger array.
         
         Time Complexity: O(n) - must copy all n elements
         Space Complexity: O(n) - allocate new array of size 2n
         
+        Args:
+            newCapacity: int or None - exact capacity to move to; if None,
+                ask the growth policy (double by default)
+        
         Strategy:
-            1. Create new array with double the capacity
-            2. Copy all existing elements to new array
+            1. Create new array with the new capacity
+            2. Copy all existing elements to new array in one slice assignment
             3. Update reference to point to new array
             4. Old array is garbage collected
             
         Note:
             This is called infrequently (only when full), so pushback
             remains O(1) amortized despite this O(n) operation.
+            The slice copy is still O(n), but it runs as a single memmove
+            in C instead of n interpreted loop iterations.
         """
-        # Create new array of double capacity
-        self.capacity = 2 * self.capacity  # Double the capacity
-        newArr = [0] * self.capacity  # Allocate new larger array
+        if newCapacity is None:  # Let the growth policy pick the next size
+            newCapacity = self.growth(self.capacity, self.length + 1)
+        self.capacity = newCapacity
+        newArr = self.allocate(self.capacity)  # Allocate new larger array
         
-        # Copy elements to newArr
-        for i in range(self.length):  # Copy only the elements in use
-            newArr[i] = self.arr[i]  # Transfer each element
+        # Copy elements to newArr (bulk copy of only the elements in use)
+        newArr[:self.length] = self.arr[:self.length]
         self.arr = newArr  # Point to the new array (old array discarded)
+
+    def reserve(self, n):
+        """
+        Make sure the array can hold at least n elements without resizing.
+        
+        Time Complexity: O(length) if a resize is needed, O(1) otherwise
+        Space Complexity: O(n)
+        
+        Args:
+            n: int - minimum capacity required
+            
+        Note:
+            Call this before a bulk load of known size to replace
+            log(n) doubling copies with a single allocation.
+        """
+        if n > self.capacity:  # Only ever grows, never shrinks
+            self.resize(n)
         
     def popback(self):
         """
@@ -116,9 +242,170 @@ class Array:
             Just decrements length so the element is considered removed.
             The value remains in memory but is inaccessible and will be
             overwritten on the next pushback.
+            With shrink=True, an O(n) shrink happens when length reaches
+            capacity / 4 (still O(1) amortized).
         """
         if self.length > 0:  # Check array is not empty
             self.length -= 1  # Simply decrease the count (lazy deletion)
+            self.shrinkIfSparse()
+
+    def shrinkIfSparse(self):
+        """
+        Halve capacity (possibly repeatedly) while length <= capacity / 4.
+        
+        Time Complexity: O(n) when it shrinks, O(1) otherwise
+        Space Complexity: O(n) - new smaller array
+        
+        Note:
+            Does nothing unless the array was created with shrink=True.
+            Never goes below a capacity of 2. All halvings are folded into
+            a single resize, so pop_many/truncate copy at most once.
+        """
+        if not self.shrink:
+            return
+        newCapacity = self.capacity
+        while newCapacity >= 4 and self.length <= newCapacity // 4:
+            newCapacity //= 2  # Result stays half full, so no immediate regrow
+        if newCapacity != self.capacity:
+            self.resize(newCapacity)
+
+    def shrink_to_fit(self):
+        """
+        Release all unused capacity so capacity == length.
+        
+        Time Complexity: O(n) - copies the elements into a right-sized array
+        Space Complexity: O(n)
+        """
+        if self.capacity > self.length:
+            self.resize(self.length)
+
+    def allocated_bytes(self):
+        """
+        Bytes held by the backing store, including unused capacity.
+        
+        Note:
+            For plain list mode this counts the list's pointer array only,
+            not the boxed int objects the pointers refer to.
+        """
+        return sys.getsizeof(self.arr)
+
+    def used_bytes(self):
+        """Bytes of the backing store actually occupied by the first `length` slots."""
+        itemsize = 8 if self.typecode is None else self.arr.itemsize  # List slots are 8-byte pointers
+        return self.length * itemsize
+
+    def grow(self, minCapacity):
+        """
+        Resize once, via the growth policy, so at least minCapacity fits.
+        
+        Time Complexity: O(n) if a resize is needed, O(1) otherwise
+        Space Complexity: O(n)
+        
+        Note:
+            Unlike reserve(), this keeps the policy's headroom, so a batch
+            followed by more pushbacks stays amortized O(1).
+        """
+        if minCapacity > self.capacity:
+            self.resize(self.growth(self.capacity, minCapacity))
+
+    def extend(self, iterable):
+        """
+        Append every element of an iterable in one batch.
+        
+        Time Complexity: O(k) for k new elements (plus one O(n) resize at most)
+        Space Complexity: O(k) - the batch is materialized once
+        
+        Args:
+            iterable: any iterable of values
+            
+        Strategy:
+            1. Materialize the batch once to learn its size k
+            2. Resize at most once so length + k fits
+            3. Copy the whole batch in with a single slice assignment
+            4. Bump length by k
+            
+        Note:
+            Compare to k pushback() calls: k capacity checks, up to log(k)
+            resizes, and k interpreted method calls.
+        """
+        if self.typecode is None:
+            values = iterable if isinstance(iterable, list) else list(iterable)
+        else:
+            values = iterable if isinstance(iterable, array) and iterable.typecode == self.typecode \
+                else array(self.typecode, iterable)  # Unbox once into a typed batch
+        k = len(values)
+        self.grow(self.length + k)  # At most one resize for the whole batch
+        self.arr[self.length:self.length + k] = values  # Bulk copy into place
+        self.length += k
+
+    def extend_from_buffer(self, buf):
+        """
+        Append the contents of a buffer (memoryview, bytes, array, NumPy array).
+        
+        Time Complexity: O(k) for k new elements
+        Space Complexity: O(1) extra in typed mode - copied straight into place
+        
+        Args:
+            buf: object supporting the buffer protocol; in typed mode its items
+                must have the same size and kind (integer or float) as the
+                Array's typecode
+                
+        Raises:
+            ValueError if the buffer's items don't match the typecode
+                
+        Note:
+            In typed mode this is a raw memory copy from buf into the backing
+            array with no per-element Python objects. Plain list mode has to
+            box every value anyway, so it falls back to extend().
+        """
+        src = memoryview(buf)
+        if self.typecode is None:
+            self.extend(src.tolist())
+            return
+        if src.format != self.typecode:  # e.g. NumPy int64 reports 'l' - reinterpret the bytes
+            fmt = src.format.lstrip('@=<>!')
+            if src.itemsize != self.arr.itemsize or (fmt in 'fd') != (self.typecode in 'fd'):
+                raise ValueError(f"buffer format {src.format!r} doesn't match typecode {self.typecode!r}")
+            src = src.cast('B').cast(self.typecode)
+        k = len(src)
+        self.grow(self.length + k)
+        with memoryview(self.arr) as dst:  # Scoped view, released as soon as the copy is done
+            dst[self.length:self.length + k] = src
+        self.length += k
+
+    def pop_many(self, k):
+        """
+        Remove the last k elements and return them.
+        
+        Time Complexity: O(k) - copying out the removed values
+        Space Complexity: O(k)
+        
+        Args:
+            k: int - number of elements to remove (clamped to [0, length])
+            
+        Returns:
+            list (or array.array in typed mode) of the removed values,
+            in array order (last popped element is first in the result)
+        """
+        k = max(0, min(k, self.length))  # Negative k would raise length past capacity
+        removed = self.arr[self.length - k:self.length]  # One slice copy
+        self.length -= k  # Lazy deletion, same as popback()
+        self.shrinkIfSparse()
+        return removed
+
+    def truncate(self, n):
+        """
+        Shrink the array to its first n elements.
+        
+        Time Complexity: O(1) - just lower the length
+        Space Complexity: O(1)
+        
+        Args:
+            n: int - new length (ignored if n >= length)
+        """
+        if 0 <= n < self.length:
+            self.length = n
+            self.shrinkIfSparse()
     
     def get(self, i):
         """
@@ -175,4 +462,193 @@ class Array:
         """
         for i in range(self.length):  # Iterate only through elements in use
             print(self.arr[i])  # Print each element
-        print()  # Empty line for formatting
\ No newline at end of file
+        print()  # Empty line for formatting
+
+    def buffer(self):
+        """
+        Return a zero-copy view of the elements in use (typed mode only).
+        
+        Time Complexity: O(1) - no elements are copied
+        Space Complexity: O(1)
+        
+        Returns:
+            memoryview over the first `length` slots of the typed buffer
+            
+        Note:
+            The view shares memory with the array: writes through it are
+            visible via get() - but only until the next resize. resize()
+            swaps in a brand-new backing array, so any exported view keeps
+            pointing at the old storage and silently goes stale. Take a
+            fresh buffer() after anything that may grow or shrink the array.
+            Plain list mode has no raw buffer to expose (raises TypeError).
+        """
+        if self.typecode is None:
+            raise TypeError("buffer() requires typed storage, e.g. Array(typecode='q')")
+        return memoryview(self.arr)[:self.length]  # Slicing a memoryview does not copy
+
+
+class MappedArray(Array):
+    """
+    A typed dynamic array stored in a memory-mapped file.
+    
+    File layout:
+        [ magic: 4 bytes | version: 1 | typecode: 1 | 2 padding | length: int64 | data ... ]
+        <----------------------- HEADER_SIZE = 16 ----------------------->
+    
+    The magic number and version identify the file as a MappedArray, so
+    opening some other file fails loudly instead of misreading it. The length
+    lives in the header and is updated on every change, so the file is always
+    reopenable. Capacity is implied by the file size.
+    """
+    
+    HEADER_SIZE = 16  # Keeps the data 8-byte aligned
+    MAGIC = b'DYNA'
+    VERSION = 1
+    HEADER_FORMAT = '<4sBc2xq'  # magic, version, typecode, padding, length
+
+    def __init__(self, path, typecode=None, capacity=2, growth='double', shrink=False, readonly=False):
+        """
+        Open (or create) a file-backed array.
+        
+        Time Complexity: O(1) - the file is mapped, not read
+        Space Complexity: O(1) - pages are loaded on demand by the OS
+        
+        Args:
+            path: str - file to map; created if missing (unless readonly)
+            typecode: str or None - array.array typecode; required when creating,
+                taken from the header (and checked if given) when reopening
+            capacity: int - initial capacity for a newly created file
+            growth: str or callable - growth policy, as for Array
+            shrink: bool - shrink policy, as for Array
+            readonly: bool - map read-only (safe to share across processes)
+        """
+        self.growth = GROWTH_POLICIES[growth] if isinstance(growth, str) else growth
+        self.shrink = shrink
+        self.readonly = readonly
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+
+        if not exists:  # Create: write header, size file for initial capacity
+            if readonly or typecode is None:
+                raise ValueError("creating a MappedArray needs a typecode and readonly=False")
+            with open(path, 'wb') as f:  # Only ever a missing or empty file
+                f.write(struct.pack(self.HEADER_FORMAT, self.MAGIC, self.VERSION, typecode.encode(), 0))
+                f.truncate(self.HEADER_SIZE + capacity * array(typecode).itemsize)
+
+        self.file = open(path, 'rb' if readonly else 'r+b')
+        header = self.file.read(self.HEADER_SIZE)
+        try:
+            if len(header) < self.HEADER_SIZE or header[:4] != self.MAGIC:
+                raise ValueError(f"{path} is not a MappedArray file")
+            _, version, code, _ = struct.unpack(self.HEADER_FORMAT, header)
+            if version != self.VERSION:
+                raise ValueError(f"{path} has MappedArray format version {version}, expected {self.VERSION}")
+            self.typecode = code.decode()  # Header is the source of truth
+            if typecode is not None and typecode != self.typecode:
+                raise ValueError(f"{path} holds typecode {self.typecode!r}, not {typecode!r}")
+        except ValueError:
+            self.file.close()
+            raise
+        self.map()
+
+    def map(self):
+        """
+        (Re)map the whole file and rebuild the header and data views.
+        
+        Time Complexity: O(1) - mapping doesn't touch the data pages
+        """
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=access)
+        self.header = memoryview(self.mm)[8:self.HEADER_SIZE].cast('q')  # header[0] is the length
+        self.arr = memoryview(self.mm)[self.HEADER_SIZE:].cast(self.typecode)
+        self.capacity = len(self.arr)
+
+    def unmap(self):
+        """Release the views and the mapping (needed before resizing the file)."""
+        self.header.release()
+        self.arr.release()
+        self.mm.close()
+
+    @property
+    def length(self):
+        """
+        Element count, read straight from the file's header.
+        
+        A read-only map may be shared with a writer that has since grown the
+        file: the header then reports more elements than this mapping covers,
+        so re-map to pick up the new size before answering.
+        """
+        n = self.header[0]
+        if n > self.capacity and self.readonly:
+            old = self.mm
+            self.header.release()
+            self.arr.release()
+            self.map()
+            try:
+                old.close()
+            except BufferError:  # A buffer() view still uses the old mapping; freed with that view
+                pass
+            n = min(self.header[0], self.capacity)
+        return n
+
+    @length.setter
+    def length(self, n):
+        self.header[0] = n  # Persisted immediately - no separate save step
+
+    def resize(self, newCapacity=None):
+        """
+        Change capacity by resizing the file and re-mapping it.
+        
+        Time Complexity: O(1) copying - existing bytes stay where they are
+            on disk; the OS zero-fills the new tail of the file
+        Space Complexity: O(n) on disk
+        
+        Raises:
+            TypeError if the array was opened read-only (checked before
+            unmapping, so the array stays usable)
+            
+        Note:
+            Any view returned by buffer() must be released first, otherwise
+            the mapping can't be closed (BufferError).
+        """
+        if self.readonly:
+            raise TypeError("cannot resize a read-only MappedArray")
+        if newCapacity is None:
+            newCapacity = self.growth(self.capacity, self.length + 1)
+        newCapacity = max(newCapacity, 1)  # Keep the data region non-empty
+        self.unmap()
+        os.ftruncate(self.file.fileno(), self.HEADER_SIZE + newCapacity * array(self.typecode).itemsize)
+        self.map()
+
+    def pop_many(self, k):
+        """
+        Remove the last k elements and return them as an array.array.
+        
+        Note:
+            Copies the values out before the length changes, since a slice of
+            the mapped view would keep pointing at reusable file space.
+        """
+        k = max(0, min(k, self.length))
+        removed = array(self.typecode, self.arr[self.length - k:self.length])
+        self.truncate(self.length - k)
+        return removed
+
+    def allocated_bytes(self):
+        """Bytes reserved for data in the file, including unused capacity."""
+        return self.capacity * self.arr.itemsize
+
+    def flush(self):
+        """Ask the OS to write dirty pages back to the file now."""
+        if not self.readonly:
+            self.mm.flush()
+
+    def close(self):
+        """Flush, unmap and close the file. The array is unusable afterwards."""
+        self.flush()
+        self.unmap()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
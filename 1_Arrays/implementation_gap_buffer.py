@@ -0,0 +1,281 @@
+"""
+Gap Buffer and Blocked Array - Cheaper Middle Inserts Than a Static Array
+
+Pattern: Array Manipulation with a Movable Hole / Square-Root Decomposition
+Concept: Alternatives to insertMiddle/removeMiddle from implementation_static_arrays.py
+
+The Problem:
+- insertMiddle()/removeMiddle() on a plain array shift everything after i: O(n)
+- Text editors do thousands of edits around a cursor - O(n) each is too slow
+
+Gap Buffer:
+- One array with an unused "gap" (hole) kept at the edit position
+    [ a b c _ _ _ _ d e ]
+            ^gapStart ^gapEnd
+- Insert at the gap: write into the hole, gapStart += 1 → O(1)
+- Delete at the gap: widen the hole, gapEnd += 1 → O(1)
+- Editing somewhere else: first slide the gap there, which moves only the
+  elements between the old and new position → O(distance), not O(n)
+- Gap used up: reallocate with a bigger gap (doubling → amortized O(1))
+- Used by Emacs and many other editors
+
+Blocked (Chunked) Array:
+- Store elements in a list of small blocks of about sqrt(n) elements each
+    [a b c] -> [d e] -> [f g h]
+- Find the block holding index i: walk block sizes → O(n / B)
+- Insert/remove inside that block: shift at most B elements → O(B)
+- With B ≈ sqrt(n): O(sqrt n) for edits anywhere, with no cursor locality needed
+- Blocks split when they get too big and merge with (or borrow from) a
+  neighbour when they fall below B/2, so there are always O(n / B) blocks
+
+Operations Time Complexity:
+                        GapBuffer                 BlockedArray
+- get(i):               O(1)                      O(n / B)
+- insertMiddle(i, n):   O(|i - cursor|) amortized O(n / B + B)
+- removeMiddle(i):      O(|i - cursor|)           O(n / B + B)
+- insertEnd/removeEnd:  O(|length - cursor|)      O(1) amortized
+
+Space Complexity: O(n) for both
+"""
+
+
+class GapBuffer:
+    """
+    An array with a movable gap so edits near the last edit are O(1).
+
+    Index semantics match the static array helpers: insertMiddle(i, n)
+    puts n at index i and shifts later elements right by one.
+    """
+
+    def __init__(self, capacity=16):
+        """
+        Initialize an empty gap buffer (the whole array is one gap).
+
+        Args:
+            capacity: int - initial number of slots
+        """
+        self.buf = [0] * capacity  # Backing array, gap slots hold junk
+        self.gapStart = 0  # First slot of the gap (= cursor position)
+        self.gapEnd = capacity  # First slot after the gap
+
+    def __len__(self):
+        return len(self.buf) - (self.gapEnd - self.gapStart)  # Capacity minus gap size
+
+    def moveGap(self, i):
+        """
+        Slide the gap so it starts at logical index i.
+
+        Time Complexity: O(|i - gapStart|) - only elements between the old
+            and the new gap position move, with one slice copy
+        Space Complexity: O(|i - gapStart|) for the slice temporary
+
+        Example (moving gap left to i = 1):
+            [ a b c _ _ d ]  →  [ a _ _ b c d ]
+        """
+        if i < self.gapStart:  # Move gap left: elements [i, gapStart) go to its right side
+            count = self.gapStart - i
+            self.buf[self.gapEnd - count:self.gapEnd] = self.buf[i:self.gapStart]
+            self.gapStart -= count
+            self.gapEnd -= count
+        elif i > self.gapStart:  # Move gap right: elements after the gap go to its left side
+            count = i - self.gapStart
+            self.buf[self.gapStart:i] = self.buf[self.gapEnd:self.gapEnd + count]
+            self.gapStart += count
+            self.gapEnd += count
+
+    def grow(self):
+        """
+        Reallocate with double the capacity, putting the extra space in the gap.
+
+        Time Complexity: O(n) - but happens rarely (amortized O(1) per insert)
+        """
+        extra = max(len(self.buf), 1)  # Double (at least 1 new slot)
+        self.buf[self.gapEnd:self.gapEnd] = [0] * extra  # Widen the gap in one splice
+        self.gapEnd += extra
+
+    def insertMiddle(self, i, n):
+        """
+        Insert n at index i, shifting later elements right.
+
+        Args:
+            i: int - 0 <= i <= len(self)
+            n: value to insert
+        """
+        self.moveGap(i)
+        if self.gapStart == self.gapEnd:  # Gap used up
+            self.grow()
+        self.buf[self.gapStart] = n  # Fill the first gap slot
+        self.gapStart += 1
+
+    def removeMiddle(self, i):
+        """
+        Remove the element at index i, shifting later elements left.
+
+        Args:
+            i: int - 0 <= i < len(self)
+
+        Returns:
+            The removed value
+        """
+        self.moveGap(i)
+        val = self.buf[self.gapEnd]  # Element right after the gap is index i
+        self.gapEnd += 1  # Swallow it into the gap
+        return val
+
+    def insertEnd(self, n):
+        """Append n (O(1) once the cursor is at the end)."""
+        self.insertMiddle(len(self), n)
+
+    def removeEnd(self):
+        """Remove and return the last element."""
+        return self.removeMiddle(len(self) - 1)
+
+    def get(self, i):
+        """
+        Return the value at logical index i in O(1).
+
+        Indices at or past the gap are shifted by the gap size.
+        """
+        if i < self.gapStart:
+            return self.buf[i]
+        return self.buf[i + self.gapEnd - self.gapStart]
+
+    def print(self):
+        """Print all elements in order, skipping the gap."""
+        for val in self.buf[:self.gapStart] + self.buf[self.gapEnd:]:
+            print(val)
+        print()
+
+
+class BlockedArray:
+    """
+    A list of small blocks giving O(sqrt n) inserts/removes at any index.
+
+    Blocks are plain Python lists; a block splits in half once it reaches
+    2 * blockSize elements, and one that drops below blockSize / 2 is
+    merged with a neighbour or refilled from it (see rebalance()).
+    """
+
+    def __init__(self, blockSize=64):
+        """
+        Initialize an empty blocked array.
+
+        Args:
+            blockSize: int - target block size B (pick ~sqrt of the expected n)
+        """
+        self.blockSize = blockSize
+        self.blocks = [[]]  # Always at least one block
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def locate(self, i):
+        """
+        Find the block holding index i.
+
+        Time Complexity: O(n / B) - walks block sizes, not elements
+
+        Returns:
+            (blockIndex, offset within that block); for i == length this is
+            the position just past the last element
+        """
+        for b, block in enumerate(self.blocks):
+            if i < len(block):
+                return b, i
+            i -= len(block)
+        return len(self.blocks) - 1, len(self.blocks[-1])  # i == length: end of last block
+
+    def insertMiddle(self, i, n):
+        """
+        Insert n at index i, shifting later elements (within one block) right.
+
+        Time Complexity: O(n / B + B)
+        """
+        b, offset = self.locate(i)
+        block = self.blocks[b]
+        block.insert(offset, n)  # Shifts at most ~2B elements
+        self.length += 1
+        if len(block) >= 2 * self.blockSize:  # Split an oversized block in half
+            half = len(block) // 2
+            self.blocks[b + 1:b + 1] = [block[half:]]
+            del block[half:]
+
+    def removeMiddle(self, i):
+        """
+        Remove and return the element at index i.
+
+        Time Complexity: O(n / B + B)
+        """
+        b, offset = self.locate(i)
+        block = self.blocks[b]
+        val = block.pop(offset)
+        self.length -= 1
+        if len(self.blocks) > 1 and (not block or len(block) < self.blockSize // 2):
+            self.rebalance(b)  # Keep blocks at least half full so locate() stays O(n / B)
+        return val
+
+    def rebalance(self, b):
+        """
+        Fix up underfull block b using its next neighbour (previous, if b is last).
+
+        Time Complexity: O(B)
+
+        Strategy:
+            - Both fit in one block (< 2B): merge them
+            - Otherwise the neighbour has plenty: move just enough elements
+              over to bring block b up to B/2
+        """
+        left, right = (b, b + 1) if b + 1 < len(self.blocks) else (b - 1, b)
+        leftBlock, rightBlock = self.blocks[left], self.blocks[right]
+        half = self.blockSize // 2
+        if len(leftBlock) + len(rightBlock) < 2 * self.blockSize:  # Merge into the left block
+            leftBlock.extend(rightBlock)
+            del self.blocks[right]
+        elif left == b:  # Borrow from the front of the next block
+            need = half - len(leftBlock)
+            leftBlock.extend(rightBlock[:need])
+            del rightBlock[:need]
+        else:  # Borrow from the end of the previous block
+            need = half - len(rightBlock)
+            rightBlock[:0] = leftBlock[len(leftBlock) - need:]
+            del leftBlock[len(leftBlock) - need:]
+
+    def insertEnd(self, n):
+        """Append n to the last block."""
+        self.insertMiddle(self.length, n)
+
+    def removeEnd(self):
+        """Remove and return the last element."""
+        return self.removeMiddle(self.length - 1)
+
+    def get(self, i):
+        """Return the value at index i in O(n / B)."""
+        b, offset = self.locate(i)
+        return self.blocks[b][offset]
+
+    def print(self):
+        """Print all elements in order."""
+        for block in self.blocks:
+            for val in block:
+                print(val)
+        print()
+
+
+if __name__ == "__main__":
+    # Gap buffer: type "helo", move cursor back and fix the typo
+    gb = GapBuffer(capacity=2)
+    for ch in "helo":
+        gb.insertEnd(ch)
+    gb.insertMiddle(3, "l")  # Gap moves 1 slot left, then O(1) insert
+    print("".join(gb.get(i) for i in range(len(gb))))  # Expected: hello
+    gb.removeMiddle(0)
+    print("".join(gb.get(i) for i in range(len(gb))))  # Expected: ello
+
+    # Blocked array: random-position edits
+    ba = BlockedArray(blockSize=2)
+    for v in range(10):
+        ba.insertEnd(v)
+    ba.insertMiddle(5, 99)
+    ba.removeMiddle(0)
+    print([ba.get(i) for i in range(len(ba))])  # Expected: [1, 2, 3, 4, 99, 5, 6, 7, 8, 9]
@@ -36,8 +36,20 @@ Implementation Note:
 - append() = pushback() from our dynamic array
 - pop() removes and returns last element
 - This is why stacks are often taught alongside arrays
+
+TypedStack (compact numeric stack):
+- Backed by an array.array of raw machine values instead of a list of
+  pointers to boxed objects (8 bytes per int64 vs ~36 bytes in a list)
+- Keeps its own length counter over a preallocated buffer, so push/pop
+  are just a store/load plus a counter update - no per-element allocation
+- reserve(n) pre-sizes the buffer; push_many/pop_many move whole batches
+- __slots__ on both classes: no per-instance __dict__
+
+See implementation_concurrent_stacks.py for a thread-safe variant.
 """
 
+from array import array
+
 
 class Stack:
     """
@@ -47,6 +59,8 @@ class Stack:
     top of arrays, restricting access to LIFO (Last In First Out) operations.
     """
     
+    __slots__ = ('stack',)  # Fixed attribute set, no per-instance __dict__
+
     def __init__(self):
         """
         Initialize an empty stack using a Python list.
@@ -92,4 +106,119 @@ class Stack:
             Unlike popback() which just decremented length, list.pop()
             actually returns the removed value.
         """
-        return self.stack.pop()  # Remove and return last element (top of stack)
\ No newline at end of file
+        return self.stack.pop()  # Remove and return last element (top of stack)
+
+    def push_many(self, values):
+        """
+        Push every value of an iterable, in order (last value ends on top).
+        
+        Time Complexity: O(k) - one list.extend instead of k appends
+        """
+        self.stack.extend(values)
+
+    def pop_many(self, k):
+        """
+        Pop the top k elements.
+        
+        Time Complexity: O(k)
+        
+        Returns:
+            list of the removed values in stack order (old top is last)
+        """
+        k = max(0, min(k, len(self.stack)))  # Clamp to [0, size]
+        removed = self.stack[len(self.stack) - k:]  # Copy out the top k
+        del self.stack[len(self.stack) - k:]  # Drop them in one operation
+        return removed
+
+
+class TypedStack:
+    """
+    A stack of fixed-width numbers stored in a preallocated array.array.
+    
+    Same push/pop API as Stack, plus reserve and batch operations.
+    The buffer grows by doubling (like our dynamic Array) and never shrinks.
+    """
+
+    __slots__ = ('typecode', 'stack', 'length')
+
+    def __init__(self, typecode='q', capacity=16):
+        """
+        Initialize an empty typed stack.
+        
+        Args:
+            typecode: str - array.array typecode ('q' int64, 'd' double, ...)
+            capacity: int - slots to preallocate
+        """
+        self.typecode = typecode
+        self.stack = array(typecode, bytes(capacity * array(typecode).itemsize))  # Zeroed buffer
+        self.length = 0  # Number of elements in use (top is stack[length - 1])
+
+    def reserve(self, n):
+        """
+        Grow the buffer so at least n elements fit without reallocating.
+        
+        Time Complexity: O(n) if it grows, O(1) otherwise
+        """
+        if n > len(self.stack):
+            self.stack.frombytes(bytes((n - len(self.stack)) * self.stack.itemsize))  # Zero-extend in place
+
+    def push(self, n):
+        """
+        Push a value onto the top of the stack.
+        
+        Time Complexity: O(1) amortized - doubles the buffer when full
+        """
+        if self.length == len(self.stack):
+            self.reserve(max(2 * self.length, 1))
+        self.stack[self.length] = n  # Store unboxed, no new slot allocated
+        self.length += 1
+
+    def pop(self):
+        """
+        Remove and return the top value.
+        
+        Time Complexity: O(1) - the slot is kept for reuse
+        
+        Raises:
+            IndexError if the stack is empty (same as list.pop)
+        """
+        if self.length == 0:
+            raise IndexError("pop from empty stack")
+        self.length -= 1
+        return self.stack[self.length]
+
+    def top(self):
+        """Return the top value without removing it."""
+        if self.length == 0:
+            raise IndexError("top from empty stack")
+        return self.stack[self.length - 1]
+
+    def __len__(self):
+        return self.length
+
+    def push_many(self, values):
+        """
+        Push every value of an iterable, in order (last value ends on top).
+        
+        Time Complexity: O(k) - one reserve and one slice copy for the batch
+        """
+        if not isinstance(values, array) or values.typecode != self.typecode:
+            values = array(self.typecode, values)  # Unbox the batch once
+        k = len(values)
+        if self.length + k > len(self.stack):
+            self.reserve(max(2 * len(self.stack), self.length + k))
+        self.stack[self.length:self.length + k] = values
+        self.length += k
+
+    def pop_many(self, k):
+        """
+        Pop the top k elements.
+        
+        Time Complexity: O(k) - one slice copy
+        
+        Returns:
+            array.array of the removed values in stack order (old top is last)
+        """
+        k = max(0, min(k, self.length))  # Negative k would expose unused slots
+        self.length -= k
+        return self.stack[self.length:self.length + k]
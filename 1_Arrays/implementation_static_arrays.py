@@ -27,6 +27,11 @@ Operations Time Complexity:
 - insertMiddle(): O(n) - must shift n elements
 - removeMiddle(): O(n) - must shift n elements
 - Access by index: O(1) - not shown but fundamental property
+
+See implementation_static_arrays_numpy.py for the same helpers with
+vectorized (single slice) shifts and batched insert/remove.
+See implementation_gap_buffer.py for structures that avoid the O(n) shift
+(gap buffer for edits near a cursor, blocked array for O(sqrt n) edits).
 """
 
 
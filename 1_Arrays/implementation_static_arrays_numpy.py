@@ -0,0 +1,173 @@
+"""
+Static Array Operations - Vectorized NumPy Backend
+
+Pattern: Array Manipulation (vectorized)
+Concept: Same static array helpers, but shifts are done by NumPy in C
+
+Same API as implementation_static_arrays.py:
+- insertEnd(arr, n, length, capacity)
+- removeEnd(arr, length)
+- insertMiddle(arr, i, n, length)
+- removeMiddle(arr, i, length)
+- printArr(arr, capacity)
+so it can be swapped in with:
+    import implementation_static_arrays_numpy as sa
+
+Why Vectorize:
+- The pure Python insertMiddle/removeMiddle shift one slot per loop iteration,
+  so a 10^6-element shift is 10^6 interpreted bytecode steps
+- A slice assignment like arr[i+1:length+1] = arr[i:length] is a single
+  memmove over contiguous memory - same O(n), but a much smaller constant
+- NumPy detects the overlapping source/destination and copies safely
+
+Batched Variants:
+- insertMiddleMany(): insert k values at k indices in one pass - O(n + k)
+  instead of k separate O(n) shifts (O(n * k))
+- removeMiddleMany(): remove k indices with one boolean mask - O(n)
+
+Requires NumPy (pip install numpy). The pure Python module has no dependencies.
+"""
+
+import numpy as np
+
+
+def insertEnd(arr, n, length, capacity):
+    """
+    Insert an element at the next available position (end of array).
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+
+    Args:
+        arr: np.ndarray - the static array
+        n: value to insert
+        length: int - current number of elements in use
+        capacity: int - total size of the array
+    """
+    if length < capacity:  # Check if there's space available
+        arr[length] = n
+
+
+def removeEnd(arr, length):
+    """
+    Remove the last element from the array (reset it to 0).
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+
+    Args:
+        arr: np.ndarray - the static array
+        length: int - current number of elements in use
+    """
+    if length > 0:  # Check if array is not empty
+        arr[length - 1] = 0
+
+
+def insertMiddle(arr, i, n, length):
+    """
+    Insert an element at index i by shifting arr[i:length] right in one slice.
+
+    Time Complexity: O(n) - but a single memmove, not n Python iterations
+    Space Complexity: O(1) - may use a temporary buffer for the overlapping copy
+
+    Args:
+        arr: np.ndarray - the static array (needs room for length + 1)
+        i: int - index where element should be inserted
+        n: value to insert
+        length: int - current number of elements in use
+    """
+    arr[i + 1:length + 1] = arr[i:length]  # Shift right (overlap handled by NumPy)
+    arr[i] = n
+
+
+def removeMiddle(arr, i, length):
+    """
+    Remove the element at index i by shifting arr[i+1:length] left in one slice.
+
+    Time Complexity: O(n) - but a single memmove
+    Space Complexity: O(1)
+
+    Args:
+        arr: np.ndarray - the static array
+        i: int - index of element to remove
+        length: int - current number of elements in use
+    """
+    arr[i:length - 1] = arr[i + 1:length]  # Shift left, overwriting arr[i]
+
+
+def insertMiddleMany(arr, indices, values, length):
+    """
+    Insert several values at once (same semantics as np.insert).
+
+    Time Complexity: O(n + k) - one pass instead of k shifts
+    Space Complexity: O(n + k) - temporary array for the merged result
+
+    Args:
+        arr: np.ndarray - the static array (needs room for length + k)
+        indices: sequence of int - positions in the CURRENT array (before any
+            insertion) that each value goes in front of
+        values: sequence - values to insert, one per index
+        length: int - current number of elements in use
+
+    Returns:
+        int - the new length (length + k)
+
+    Example:
+        arr = [1, 2, 3, _, _], insertMiddleMany(arr, [0, 2], [9, 8], 3)
+        → arr = [9, 1, 2, 8, 3], returns 5
+    """
+    merged = np.insert(arr[:length], indices, values)  # Single merge pass in C
+    arr[:len(merged)] = merged
+    return len(merged)
+
+
+def removeMiddleMany(arr, indices, length):
+    """
+    Remove several indices at once using a boolean keep-mask.
+
+    Time Complexity: O(n) - one masked compaction for all k removals
+    Space Complexity: O(n) - the mask and the compacted temporary
+
+    Args:
+        arr: np.ndarray - the static array
+        indices: sequence of int - positions to remove (duplicates allowed)
+        length: int - current number of elements in use
+
+    Returns:
+        int - the new length
+    """
+    keep = np.ones(length, dtype=bool)
+    keep[np.asarray(indices, dtype=np.intp)] = False  # Mark removals
+    kept = arr[:length][keep]  # Boolean indexing compacts in one pass
+    arr[:len(kept)] = kept
+    return len(kept)
+
+
+def printArr(arr, capacity):
+    """
+    Print all elements in the array up to capacity, one per line.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n) - builds the output string once
+    """
+    print("\n".join(map(str, arr[:capacity].tolist())))  # One write instead of n print calls
+
+
+if __name__ == "__main__":
+    arr = np.zeros(8, dtype=np.int64)
+    length = 0
+    for v in (10, 20, 30):
+        insertEnd(arr, v, length, len(arr))
+        length += 1
+
+    insertMiddle(arr, 1, 15, length)  # [10, 15, 20, 30]
+    length += 1
+    removeMiddle(arr, 0, length)  # [15, 20, 30]
+    length -= 1
+    print(arr[:length])  # Expected: [15 20 30]
+
+    length = insertMiddleMany(arr, [0, 2], [1, 2], length)
+    print(arr[:length])  # Expected: [ 1 15 20  2 30]
+
+    length = removeMiddleMany(arr, [1, 3], length)
+    print(arr[:length])  # Expected: [ 1 20 30]
@@ -0,0 +1,114 @@
+from array import array
+
+class MinStack:
+    """
+    A memory-lean stack that supports O(1) retrieval of the minimum element.
+
+    Problem: LeetCode 155 - Min Stack
+    Pattern: Stack + Auxiliary Min Stack (record minimum only when it changes)
+
+    Approach:
+    - Store the values themselves in one compact array.array (unboxed ints)
+    - Keep a separate min stack that only gets a new entry when a value
+      BEATS the current minimum
+    - Repeats of the current minimum just bump a count instead of adding
+      an entry, so [5, 5, 5, 5] costs one min entry, not four
+    - On pop, if the popped value equals the current minimum, decrement its
+      count and drop the entry once the count reaches zero
+
+    Key Insight (vs v1):
+    - v1 stores a (value, min) tuple for EVERY push: 2n slots plus a tuple
+      object allocated per push
+    - Here the min stack only grows when the minimum changes, so on
+      mostly-increasing streams it stays tiny, and nothing is allocated per push
+    - Worst case (strictly decreasing input) is still n min entries, same as v1
+
+    Time Complexity:
+    - push(): O(1) amortized
+    - pop(): O(1)
+    - top(): O(1)
+    - getMin(): O(1) - top of the min stack
+
+    Space Complexity: O(n) values + O(m) min entries, m = number of distinct
+    times a new minimum was set (m <= n)
+
+    Example state progression:
+    push(-2): values = [-2],        mins = [-2], counts = [1]
+    push(0):  values = [-2, 0],     mins = [-2], counts = [1]   # 0 isn't a new min
+    push(-3): values = [-2, 0, -3], mins = [-2, -3], counts = [1, 1]
+    push(-3): values = [.., -3, -3], mins = [-2, -3], counts = [1, 2]  # repeat
+    pop():    values = [-2, 0, -3], mins = [-2, -3], counts = [1, 1]
+    """
+
+    def __init__(self, typecode: str = 'q'):
+        """
+        Initialize the MinStack with empty value and min stacks.
+
+        Args:
+            typecode: str - array.array typecode for stored values
+                ('q' = 64-bit signed int covers LeetCode's int range)
+        """
+        self.values = array(typecode)  # All pushed values, unboxed
+        self.mins = array(typecode)  # Distinct minimums, newest on top
+        self.counts = array('q')  # How many stacked values equal mins[i]
+
+    def push(self, val: int) -> None:
+        """
+        Push a value, recording a new minimum only if it changes.
+
+        Args:
+            val: int - value to push onto the stack
+        """
+        self.values.append(val)
+        if not self.mins or val < self.mins[-1]:  # New strictly smaller minimum
+            self.mins.append(val)
+            self.counts.append(1)
+        elif val == self.mins[-1]:  # Repeat of current minimum: just count it
+            self.counts[-1] += 1
+
+    def pop(self) -> None:
+        """
+        Remove the top element, retiring its minimum entry if it was the last copy.
+        """
+        val = self.values.pop()
+        if val == self.mins[-1]:  # Popped a copy of the current minimum
+            self.counts[-1] -= 1
+            if self.counts[-1] == 0:  # Last copy gone: previous minimum is back
+                self.mins.pop()
+                self.counts.pop()
+
+    def top(self) -> int:
+        """
+        Get the top element's value without removing it.
+        """
+        return self.values[-1]
+
+    def getMin(self) -> int:
+        """
+        Retrieve the minimum element in the stack in O(1) time.
+        """
+        return self.mins[-1]
+
+
+if __name__ == "__main__":
+    # Test case from problem description
+    obj = MinStack()
+
+    obj.push(-2) # values: [-2], mins: [-2]
+    obj.push(0) # values: [-2, 0], mins: [-2]
+    obj.push(-3) # values: [-2, 0, -3], mins: [-2, -3]
+
+    print(obj.getMin()) # Expected: -3
+
+    obj.pop() # values: [-2, 0], mins: [-2]
+
+    print(obj.top()) # Expected: 0
+
+    print(obj.getMin()) # Expected: -2
+
+    # Repeated minimums are counted, not stored again
+    obj = MinStack()
+    for val in [1, 1, 1]:
+        obj.push(val)
+    obj.pop()
+    print(obj.getMin(), len(obj.mins)) # Expected: 1 1
@@ -0,0 +1,202 @@
+import operator
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+AGGREGATES = {'min': min, 'max': max, 'sum': operator.add}  # Built-in aggregates by name
+
+class AggregateStack:
+    """
+    A stack that supports O(1) min, max, sum, count and a custom aggregate.
+
+    Problem: LeetCode 155 - Min Stack (generalized)
+    Pattern: Stack + Auxiliary Data (aggregate of everything at or below each level)
+
+    Approach:
+    - Same idea as v1: each level stores the answer for "this element and
+      everything below it", so popping automatically restores the old answer
+    - Instead of just the minimum, each level stores (value, *aggregates), one
+      entry per tracked aggregate - only the ones asked for are computed
+    - agg is an optional user-supplied associative function, e.g. gcd, bitwise
+      or, or matrix product - anything where (a op b) op c == a op (b op c).
+      Values that min/max/sum can't handle (matrices) need aggregates=()
+    - count is just the stack height
+
+    Time Complexity:
+    - push(): O(number of tracked aggregates); pop(), top(): O(1)
+    - getMin(), getMax(), getSum(), getAggregate(), len(): O(1)
+
+    Space Complexity: O(n) - one tuple of aggregates per level
+    """
+
+    def __init__(self, combine: Optional[Callable] = None, reverse: bool = False,
+                 aggregates: Iterable[str] = ('min', 'max', 'sum')):
+        """
+        Initialize an empty aggregate stack.
+
+        Args:
+            combine: associative function (a, b) -> value, or None
+            reverse: if True, combine as op(newValue, belowAgg) instead of
+                op(belowAgg, newValue) - used by MonotonicQueue for its
+                out-stack, whose newest push is the OLDEST queue element
+            aggregates: which built-in aggregates to track ('min', 'max', 'sum')
+        """
+        names = list(aggregates)
+        unknown = [name for name in names if name not in AGGREGATES]
+        if unknown:
+            raise ValueError(f"unknown aggregates {unknown}; choose from {list(AGGREGATES)}")
+        self.ops = [AGGREGATES[name] for name in names]
+        if combine is not None:
+            names.append('agg')
+            self.ops.append(combine)
+        self.index = {name: i + 1 for i, name in enumerate(names)}  # Tuple position per aggregate
+        self.stack = []  # Tuples of (value, *aggregates) per level
+        self.combine = combine
+        self.reverse = reverse
+
+    def push(self, val) -> None:
+        """
+        Push a value along with the aggregates up to this level.
+        """
+        if not self.stack:  # First element is every aggregate of itself
+            self.stack.append((val,) * (len(self.ops) + 1))
+            return
+        below = self.stack[-1]
+        if self.reverse:
+            aggs = [op(val, agg) for op, agg in zip(self.ops, below[1:])]
+        else:
+            aggs = [op(agg, val) for op, agg in zip(self.ops, below[1:])]
+        self.stack.append((val, *aggs))
+
+    def pop(self):
+        """
+        Remove and return the top value; the level below already has its aggregates.
+        """
+        return self.stack.pop()[0]
+
+    def top(self):
+        return self.stack[-1][0]
+
+    def position(self, name: str) -> int:
+        """Tuple index of a tracked aggregate, or a clear error if it isn't tracked."""
+        if name not in self.index:
+            if name == 'agg':
+                raise ValueError("getAggregate() needs a combine function")
+            raise ValueError(f"{name!r} is not tracked - pass it in aggregates")
+        return self.index[name]
+
+    def get(self, name: str):
+        i = self.position(name)  # Check the name first, even on an empty stack
+        return self.stack[-1][i]
+
+    def getMin(self):
+        return self.get('min')
+
+    def getMax(self):
+        return self.get('max')
+
+    def getSum(self):
+        return self.get('sum')
+
+    def getAggregate(self):
+        return self.get('agg')
+
+    def __len__(self):
+        return len(self.stack)
+
+
+class MonotonicQueue:
+    """
+    A FIFO queue with O(1) amortized min/max/sum/aggregate, built from two AggregateStacks.
+
+    Pattern: Queue from Two Stacks + Aggregate Stack
+
+    Approach:
+    - push() goes onto the in-stack
+    - pop() comes off the out-stack; when it's empty, move everything from
+      the in-stack over (this reverses the order, so the oldest is on top)
+    - Each element moves between stacks at most once → amortized O(1)
+    - The queue's aggregate = combine(out-stack agg, in-stack agg), because
+      every out-stack element is older than every in-stack element
+
+    Use Case - Sliding Window:
+    - push the new element, pop the one leaving the window, read getMin()/
+      getMax() - amortized O(1) per step instead of rescanning k elements
+    """
+
+    def __init__(self, combine: Optional[Callable] = None, aggregates: Iterable[str] = ('min', 'max', 'sum')):
+        aggregates = tuple(aggregates)
+        self.inStack = AggregateStack(combine, aggregates=aggregates)
+        self.outStack = AggregateStack(combine, reverse=True, aggregates=aggregates)
+
+    def push(self, val) -> None:
+        self.inStack.push(val)
+
+    def pop(self):
+        """
+        Remove and return the oldest value.
+
+        Time Complexity: O(1) amortized - the transfer is paid for by the pushes
+        """
+        if not self.outStack:
+            while self.inStack:  # Reverse into the out-stack, oldest ends on top
+                self.outStack.push(self.inStack.pop())
+        return self.outStack.pop()
+
+    def merged(self, name: str):
+        """Combine one aggregate from both stacks (whichever are non-empty)."""
+        i = self.inStack.position(name)  # Raises if the aggregate isn't tracked
+        parts = [s.stack[-1][i] for s in (self.outStack, self.inStack) if s]
+        return parts[0] if len(parts) == 1 else self.inStack.ops[i - 1](parts[0], parts[1])
+
+    def getMin(self):
+        return self.merged('min')
+
+    def getMax(self):
+        return self.merged('max')
+
+    def getSum(self):
+        return self.merged('sum')
+
+    def getAggregate(self):
+        return self.merged('agg')
+
+    def __len__(self):
+        return len(self.inStack) + len(self.outStack)
+
+
+def slidingWindowMinMax(stream: Iterable, k: int) -> Iterator[Tuple]:
+    """
+    Yield (min, max) of every full window of size k over a stream.
+
+    Time Complexity: O(1) amortized per element
+    Space Complexity: O(k)
+    """
+    window = MonotonicQueue(aggregates=('min', 'max'))  # No need to track the sum
+    for val in stream:
+        window.push(val)
+        if len(window) > k:  # Slide: drop the element leaving the window
+            window.pop()
+        if len(window) == k:
+            yield window.getMin(), window.getMax()
+
+
+if __name__ == "__main__":
+    from math import gcd
+
+    obj = AggregateStack(combine=gcd)
+    for val in [12, 18, 4, 30]:
+        obj.push(val)
+    print(obj.getMin(), obj.getMax(), obj.getSum(), len(obj), obj.getAggregate()) # Expected: 4 30 64 4 2
+    obj.pop()
+    obj.pop()
+    print(obj.getMin(), obj.getMax(), obj.getAggregate()) # Expected: 12 18 6
+
+    # Non-commutative aggregate keeps queue order: string concatenation
+    q = MonotonicQueue(combine=lambda a, b: a + b)
+    for ch in "abcd":
+        q.push(ch)
+    q.pop()
+    q.push("e")
+    print(q.getAggregate()) # Expected: bcde
+
+    print(list(slidingWindowMinMax([1, 3, -1, -3, 5, 3, 6, 7], 3)))
+    # Expected: [(-1, 3), (-3, 3), (-3, 5), (-3, 5), (3, 6), (3, 7)]
@@ -0,0 +1,106 @@
+from array import array
+from collections.abc import Sequence
+from itertools import chain, repeat
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - only used to tile ndarrays
+    np = None
+
+class RepeatedView(Sequence):
+    """
+    A read-only view of `base` repeated k times, without copying it.
+
+    Pattern: Index Arithmetic (virtual array)
+
+    Key Insight:
+    - ans[i] in the concatenation is just nums[i % n], so we never need to
+      build ans - we can answer any index from the original array
+    - len = n * k, iteration walks base k times
+    - The view shares the original buffer: later changes to nums show up in it
+    """
+
+    def __init__(self, base, k: int = 2):
+        self.base = base  # Original array, referenced not copied
+        self.k = k
+
+    def __len__(self) -> int:
+        return len(self.base) * self.k
+
+    def __getitem__(self, i):
+        """
+        Index (O(1)) or slice (O(length of the slice)) into the virtual array.
+
+        Slices return a new list containing only the requested elements.
+        """
+        if isinstance(i, slice):
+            return [self.base[j % len(self.base)] for j in range(*i.indices(len(self)))]
+        if i < 0:  # Negative indexing like a normal list
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("RepeatedView index out of range")
+        return self.base[i % len(self.base)]
+
+    def __iter__(self):
+        return chain.from_iterable(repeat(self.base, self.k))  # Walks base k times, no copy
+
+    def __repr__(self) -> str:
+        return f"RepeatedView({self.base!r}, k={self.k})"
+
+
+class Solution:
+    def getConcatenation(self, nums: List[int], k: int = 2, lazy: bool = False):
+        """
+        Concatenate the array with itself (k times in general).
+
+        Problem: LeetCode 1929 - Concatenation of Array
+        Pattern: Array Manipulation
+
+        Approach:
+        - lazy=True: return a RepeatedView - O(1) time and space, nothing copied
+        - otherwise materialize with a bulk repeat that runs in C:
+          - list → nums * k
+          - array.array → nums * k (stays a compact typed array)
+          - np.ndarray → np.tile(nums, k)
+
+        Time Complexity: O(1) lazy, O(n * k) materialized
+        Space Complexity: O(1) lazy, O(n * k) materialized
+
+        Args:
+            nums: List[int], array.array or np.ndarray - input of length n
+            k: int - number of copies (LeetCode asks for 2)
+            lazy: bool - return a view instead of a new array
+
+        Returns:
+            Sequence of length n * k where ans[i] == nums[i % n]
+        """
+        if lazy:
+            return RepeatedView(nums, k)
+        if np is not None and isinstance(nums, np.ndarray):
+            return np.tile(nums, k)
+        if isinstance(nums, (list, array)):
+            return nums * k  # Sequence repetition is a bulk copy in C
+        return list(nums) * k
+
+
+if __name__ == "__main__":
+    # Test case 1: Array of length 3
+    solver = Solution()
+    nums1 = [1,2,1]
+    output1 = solver.getConcatenation(nums=nums1)
+    print(output1) # Expected: [1, 2, 1, 1, 2, 1]
+
+    # Test case 2: Array of length 4
+    solver = Solution()
+    nums2 = [1,3,2,1]
+    output2 = solver.getConcatenation(nums=nums2)
+    print(output2) # Expected: [1, 3, 2, 1, 1, 3, 2, 1]
+
+    # Test case 3: Lazy view, k = 3
+    view = solver.getConcatenation(nums=nums2, k=3, lazy=True)
+    print(len(view), view[5], view[-1], view[2:7]) # Expected: 12 3 1 [2, 1, 1, 3, 2]
+    print(list(view) == nums2 * 3) # Expected: True
+
+    # Test case 4: Typed array stays typed
+    print(solver.getConcatenation(nums=array('i', [7, 8]))) # Expected: array('i', [7, 8, 7, 8])
@@ -0,0 +1,145 @@
+from array import array
+from typing import Iterable, Union
+import mmap
+import os
+
+class Solution:
+    def isValid(self, s: str) -> bool:
+        """
+        Determine if a string of brackets is valid.
+
+        Same answer as v1-v4 for bracket-only input (LeetCode's constraint).
+        Unlike v4, other characters are skipped rather than rejected, so
+        isValid('a') is True here - see validateStream().
+
+        Problem: LeetCode 20 - Valid Parentheses
+        Pattern: Stack + Hashmap, streaming
+
+        Thin wrapper around validateStream() so the streaming code path is
+        the one being exercised by the LeetCode examples below.
+        """
+        return self.validateStream([s]) == -1
+
+    def validateStream(self, source: Union[str, os.PathLike, bytes, Iterable], chunkSize: int = 1 << 20) -> int:
+        """
+        Validate brackets in a stream of chunks, holding only the open-bracket stack.
+
+        Problem: LeetCode 20 - Valid Parentheses (for inputs bigger than RAM)
+        Pattern: Stack + Hashmap, carried across chunk boundaries
+
+        Approach:
+        - Same algorithm as v4: push openers, match closers against the top
+        - The stack is the ONLY state that matters between characters, so we
+          can process the input chunk by chunk and keep just the stack
+        - Alongside each opener we store its byte offset, so an unclosed
+          bracket can be reported by position
+        - Characters that aren't brackets are skipped (real documents have text
+          between the brackets)
+
+        Time Complexity: O(n) - single pass over the input
+        Space Complexity: O(d + chunkSize) - d = max nesting depth, independent of n
+
+        Args:
+            source: one of
+                - a path (str or os.PathLike), read in chunkSize pieces
+                - an open binary file object (anything with .read)
+                - bytes / bytearray / memoryview / mmap (sliced without copying,
+                  always from the start - an mmap's seek position is ignored)
+                - any iterable of str or bytes chunks - to validate text held
+                  in a str, wrap it in a list: validateStream([text])
+            chunkSize: int - bytes read per chunk for files and buffers
+
+        Returns:
+            int - -1 if valid, otherwise the byte offset of the first error:
+                the closer that didn't match, or (at end of input) the
+                earliest opener that was never closed
+
+        Note:
+            str chunks are UTF-8 encoded, so offsets are always byte offsets.
+            Brackets are ASCII and UTF-8 continuation bytes are >= 0x80,
+            so multi-byte characters can never be mistaken for brackets.
+        """
+        closeToOpen = {ord(')'): ord('('), ord(']'): ord('['), ord('}'): ord('{')}
+        openers = frozenset(closeToOpen.values())
+
+        stack = bytearray()  # Open brackets still waiting for a closer
+        offsets = array('q')  # Byte offset of each opener in stack
+        base = 0  # Byte offset of the current chunk's first byte
+
+        for chunk in self.chunks(source, chunkSize):
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            for i, b in enumerate(chunk):  # Iterating bytes yields ints
+                if b in openers:
+                    stack.append(b)
+                    offsets.append(base + i)
+                elif b in closeToOpen:
+                    if not stack or stack[-1] != closeToOpen[b]:
+                        return base + i  # Unexpected or mismatched closer
+                    stack.pop()
+                    offsets.pop()
+            base += len(chunk)
+
+        return offsets[0] if stack else -1  # Earliest unclosed opener, or valid
+
+    def chunks(self, source, chunkSize: int):
+        """
+        Yield the input as a sequence of chunks without loading it all at once.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:  # Path: stream it from disk
+                yield from self.chunks(f, chunkSize)
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            # Checked before .read: an mmap has read() too, but slicing a view
+            # is zero-copy and covers the whole map regardless of seek position
+            with memoryview(source) as view:
+                for start in range(0, len(view), chunkSize):
+                    yield view[start:start + chunkSize]
+        elif hasattr(source, 'read'):  # File object: read fixed-size pieces
+            while True:
+                chunk = source.read(chunkSize)
+                if not chunk:
+                    break
+                yield chunk
+        else:  # Iterable of chunks
+            yield from source
+
+
+if __name__ == "__main__":
+    # Test case 1: Simple valid pair
+    solver = Solution()
+    s1 = "()"
+    output1 = solver.isValid(s=s1)
+    print(output1)  # Expected: True
+
+    # Test case 2: Multiple valid pairs in sequence
+    solver = Solution()
+    s2 = "()[]{}"
+    output2 = solver.isValid(s=s2)
+    print(output2)  # Expected: True
+
+    # Test case 3: Mismatched bracket types
+    solver = Solution()
+    s3 = "(]"
+    output3 = solver.isValid(s=s3)
+    print(output3)  # Expected: False
+
+    # Test case 4: Properly nested brackets
+    solver = Solution()
+    s4 = "([])"
+    output4 = solver.isValid(s=s4)
+    print(output4)  # Expected: True
+
+    # Test case 5: Invalid nesting - brackets interleaved incorrectly
+    solver = Solution()
+    s5 = "([)]"
+    output5 = solver.isValid(s=s5)
+    print(output5)  # Expected: False
+
+    # Test case 6: Brackets split across chunk boundaries
+    output6 = solver.validateStream(["{ a: [1, ", "(2)], b: ", "3 }"])
+    print(output6)  # Expected: -1 (valid)
+
+    # Test case 7: Error offsets
+    print(solver.validateStream(b"{[x)]}", chunkSize=2))  # Expected: 3 (the ')')
+    print(solver.validateStream([b"(()", b"[]"]))  # Expected: 0 (the first '(' is never closed)
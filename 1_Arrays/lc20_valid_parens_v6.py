@@ -0,0 +1,137 @@
+from typing import Union
+import importlib
+import sys
+import time
+
+OPEN = 1  # Marker for opening brackets in TABLE
+
+# 256-entry lookup table indexed by byte value:
+#   0     → not a bracket (invalid input)
+#   OPEN  → opening bracket
+#   other → closing bracket; the value is the byte of its matching opener
+TABLE = bytearray(256)
+for opener, closer in (b'()', b'[]', b'{}'):
+    TABLE[opener] = OPEN
+    TABLE[closer] = opener
+
+class Solution:
+    def isValid(self, s: Union[str, bytes]) -> bool:
+        """
+        Determine if a string of brackets is valid, tuned for large inputs.
+
+        Problem: LeetCode 20 - Valid Parentheses
+        Pattern: Stack + Lookup Table, with O(1)-per-byte C-level pre-checks
+
+        Approach:
+        - Work on bytes: iterating bytes yields small ints, and indexing a
+          bytearray table with an int is cheaper than hashing a 1-char str
+        - Reject cheap cases before the main loop, using methods that run in C:
+          1. odd length → some bracket can't have a partner
+          2. any byte that isn't a bracket → invalid input
+          3. count('(') != count(')') (and same for [] and {}) → unbalanced
+        - Main loop: TABLE[b] tells us "opener" or "closer of X" in one lookup
+        - Stack is a bytearray (one byte per open bracket, no object pointers)
+        - For a closer we pop() first and compare after - if it doesn't match
+          we return False anyway, so the order doesn't matter
+        - The empty-stack check is an exception handler around the loop instead
+          of an `if not stack` test on every closer
+
+        Time Complexity: O(n) - the pre-checks are a few extra C-speed passes
+        Space Complexity: O(n) worst case, 1 byte per open bracket
+
+        Args:
+            s: str or bytes - only bracket characters: ()[]{}
+
+        Returns:
+            bool - True if all brackets are properly matched and nested
+        """
+        data = s.encode() if isinstance(s, str) else s
+
+        if len(data) % 2:  # Odd length can never be fully paired
+            return False
+        if data.translate(None, b'()[]{}'):  # Anything left after deleting brackets is invalid
+            return False
+        if data.count(b'(') != data.count(b')') or data.count(b'[') != data.count(b']') \
+                or data.count(b'{') != data.count(b'}'):
+            return False  # Per-type imbalance
+
+        table = TABLE  # Local variable lookups are faster than globals
+        stack = bytearray()
+        push = stack.append
+        pop = stack.pop
+        try:
+            for b in data:
+                t = table[b]
+                if t == OPEN:
+                    push(b)
+                elif pop() != t:  # Closer doesn't match the most recent opener
+                    return False
+        except IndexError:  # pop() on an empty stack: closer with no opener
+            return False
+        return not stack
+
+
+def benchmark(sizes=(1 << 20, 16 << 20), versions=('v1', 'v2', 'v3', 'v4')):
+    """
+    Time v1-v4 against this version on valid deeply-mixed inputs.
+
+    Takes ~15 s with the default sizes, so running the file only does it
+    when asked: python lc20_valid_parens_v6.py --benchmark
+
+    Args:
+        sizes: input sizes in bytes (pass e.g. (1 << 30,) for a 1 GB run -
+            v1-v4 need ~n * 8 bytes of list stack, so budget RAM accordingly)
+        versions: which earlier lc20_valid_parens_<v> modules to compare
+    """
+    pattern = b'([{}])[]{()}'
+    for size in sizes:
+        data = pattern * (size // len(pattern))
+        text = data.decode()
+        print(f"input: {len(data) / (1 << 20):.0f} MB")
+        for v in versions:
+            old = importlib.import_module(f"lc20_valid_parens_{v}").Solution()
+            start = time.perf_counter()
+            old.isValid(text)
+            print(f"  {v:<16}{time.perf_counter() - start:8.3f} s")
+        for label, arg in (('v6 bytes', data), ('v6 str', text)):
+            start = time.perf_counter()
+            Solution().isValid(arg)
+            print(f"  {label:<16}{time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        Solution().isValid(data + b')')  # Odd length: rejected before the loop
+        print(f"  {'v6 early reject':<16}{time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    # Test case 1: Simple valid pair
+    solver = Solution()
+    s1 = "()"
+    output1 = solver.isValid(s=s1)
+    print(output1)  # Expected: True
+
+    # Test case 2: Multiple valid pairs in sequence
+    solver = Solution()
+    s2 = "()[]{}"
+    output2 = solver.isValid(s=s2)
+    print(output2)  # Expected: True
+
+    # Test case 3: Mismatched bracket types
+    solver = Solution()
+    s3 = "(]"
+    output3 = solver.isValid(s=s3)
+    print(output3)  # Expected: False
+
+    # Test case 4: Properly nested brackets
+    solver = Solution()
+    s4 = b"([])"
+    output4 = solver.isValid(s=s4)
+    print(output4)  # Expected: True
+
+    # Test case 5: Invalid nesting - brackets interleaved incorrectly
+    solver = Solution()
+    s5 = b"([)]"
+    output5 = solver.isValid(s=s5)
+    print(output5)  # Expected: False
+
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
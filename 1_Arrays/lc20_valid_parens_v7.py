@@ -0,0 +1,191 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple, Union
+import os
+
+bracket_map = {')': '(', ']': '[', '}': '{'}  # Same map as v4: closing → opening
+
+CLOSERS = ''.join(bracket_map).encode()
+OPENERS = ''.join(bracket_map.values()).encode()
+TO_OPENER = bytes.maketrans(CLOSERS, OPENERS)  # Rewrites each closer as its opener
+
+Summary = Optional[Tuple[bytes, bytes]]  # (unmatched closers, unmatched openers), None = mismatch
+
+
+def reduceSegment(data: bytes) -> Summary:
+    """
+    Reduce one segment to what it still needs from its neighbours.
+
+    Every segment, after cancelling its own matched pairs, looks like
+        ) ] ) ... ( { [
+        ^closers   ^openers
+    - closers: appeared with nothing open to their left INSIDE the segment,
+      so they must be matched by openers from earlier segments
+    - openers: still open at the end, to be matched by later segments
+    - a closer that meets the WRONG opener inside the segment can never be
+      fixed by neighbours → None
+
+    Time Complexity: O(len(data))
+    Space Complexity: O(unmatched brackets)
+    """
+    closeToOpen = {ord(c): ord(o) for c, o in bracket_map.items()}
+    closers = bytearray()
+    stack = bytearray()
+    for b in data:
+        if b in closeToOpen:
+            if not stack:  # Nothing open here: left neighbour's problem
+                closers.append(b)
+            elif stack.pop() != closeToOpen[b]:
+                return None  # Wrong type closes this opener: invalid everywhere
+        else:
+            stack.append(b)
+    return bytes(closers), bytes(stack)
+
+
+def foldSummaries(summaries) -> bool:
+    """
+    Fold segment summaries left to right and report whether everything matched.
+
+    The openers still open so far live in ONE mutable bytearray. Each
+    segment's leading closers meet them innermost first:
+        open so far = "{([" , segment = ("])", Ro)
+        "[" pairs with "]", "(" pairs with ")" → open so far = "{" + Ro
+    then the segment's own openers are appended in place. Rebuilding the
+    accumulator as new bytes per segment would cost O(segments * depth)
+    copying on deeply nested input; this touches each summary byte once.
+
+    Time Complexity: O(total summary size)
+    Space Complexity: O(max nesting depth)
+    """
+    openers = bytearray()  # Unmatched openers of everything folded so far
+    for summary in summaries:
+        if summary is None:
+            return False
+        closers, segmentOpeners = summary
+        m = len(closers)
+        if m > len(openers):  # A closer with nothing open anywhere to its left
+            return False
+        # Innermost opener (end of openers) pairs with the segment's first closer
+        if openers[len(openers) - m:] != closers[::-1].translate(TO_OPENER):
+            return False
+        del openers[len(openers) - m:]
+        openers += segmentOpeners
+    return not openers
+
+
+def mapBounded(pool, fn, argsList: Iterable[tuple], window: int) -> Iterator:
+    """
+    Like pool.map(fn, ...), but with at most `window` tasks in flight.
+
+    pool.map submits every task up front, so all segments would be pickled
+    and queued at once. Here the next task is only submitted once the oldest
+    result has been taken, keeping memory bounded. Results come back in order.
+    """
+    pending = deque()
+    try:
+        for args in argsList:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(pool.submit(fn, *args))
+        while pending:
+            yield pending.popleft().result()
+    finally:  # Stopped early (e.g. mismatch found): don't start queued tasks
+        for future in pending:
+            future.cancel()
+
+
+def reduceFileRange(path: str, start: int, length: int) -> Summary:
+    """Read one byte range of a file (inside a worker process) and reduce it."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return reduceSegment(f.read(length))
+
+
+class Solution:
+    def isValid(self, s: Union[str, bytes], workers: Optional[int] = None, segmentSize: int = 1 << 22) -> bool:
+        """
+        Determine if a string of brackets is valid using all CPU cores.
+
+        Problem: LeetCode 20 - Valid Parentheses
+        Pattern: Divide and Conquer - parallel map + ordered fold
+
+        Approach:
+        - Split the input into segments
+        - Map: each worker process reduces its segment to a summary of
+          (unmatched closers, unmatched openers) - see reduceSegment()
+        - Reduce: fold the summaries left to right into one bytearray of
+          still-open brackets - see foldSummaries()
+        - Valid iff the final summary has nothing unmatched on either side
+
+        Time Complexity: O(n / p + total summary size) with p processes
+        Space Complexity: O(segmentSize * p) in flight (at most 2p segments are
+            submitted at a time), plus the input itself and the summaries
+
+        Args:
+            s: str or bytes - only bracket characters: ()[]{}
+            workers: int or None - process count (None = os.cpu_count())
+            segmentSize: int - bytes per segment
+
+        Note:
+            Segments are pickled to the workers, so for inputs that already
+            live in a file use validateFile(), which sends only offsets.
+            Small inputs are reduced in-process (no pool start-up cost).
+        """
+        data = s.encode() if isinstance(s, str) else bytes(s)
+        if len(data) <= segmentSize:
+            return reduceSegment(data) == (b'', b'')
+        workers = workers or os.cpu_count()
+        segments = ((data[i:i + segmentSize],) for i in range(0, len(data), segmentSize))  # Sliced lazily
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = mapBounded(pool, reduceSegment, segments, 2 * workers)
+            return foldSummaries(summaries)
+
+    def validateFile(self, path: str, workers: Optional[int] = None, segmentSize: int = 1 << 24) -> bool:
+        """
+        Validate a bracket file in parallel; each worker reads its own byte range.
+
+        Time Complexity: O(n / p + total summary size)
+        Space Complexity: O(segmentSize) per worker
+        """
+        size = os.path.getsize(path)
+        workers = workers or os.cpu_count()
+        ranges = ((path, start, segmentSize) for start in range(0, size, segmentSize))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = mapBounded(pool, reduceFileRange, ranges, 2 * workers)
+            return foldSummaries(summaries)
+
+
+if __name__ == "__main__":
+    # Test case 1: Simple valid pair
+    solver = Solution()
+    s1 = "()"
+    output1 = solver.isValid(s=s1)
+    print(output1)  # Expected: True
+
+    # Test case 2: Multiple valid pairs in sequence
+    solver = Solution()
+    s2 = "()[]{}"
+    output2 = solver.isValid(s=s2)
+    print(output2)  # Expected: True
+
+    # Test case 3: Mismatched bracket types
+    solver = Solution()
+    s3 = "(]"
+    output3 = solver.isValid(s=s3)
+    print(output3)  # Expected: False
+
+    # Test case 4: Properly nested brackets
+    solver = Solution()
+    s4 = "([])"
+    output4 = solver.isValid(s=s4)
+    print(output4)  # Expected: True
+
+    # Test case 5: Invalid nesting - brackets interleaved incorrectly
+    solver = Solution()
+    s5 = "([)]"
+    output5 = solver.isValid(s=s5)
+    print(output5)  # Expected: False
+
+    # Test case 6: Pairs spanning segment boundaries, split 2 bytes at a time
+    print(solver.isValid("{[(())]}" * 3, workers=2, segmentSize=2))  # Expected: True
+    print(solver.isValid("{[(()])}" * 3, workers=2, segmentSize=2))  # Expected: False
@@ -0,0 +1,168 @@
+from functools import lru_cache
+from typing import Iterable, Sequence, Tuple
+import re
+
+OPEN, CLOSE, OPAQUE, STRAY = 0, 1, 2, 3  # Token kinds (STRAY: opaque closer outside its span)
+
+
+class Validator:
+    """
+    A delimiter spec compiled once into a tokenizer + lookup table.
+
+    Pattern: Stack + Hashmap, generalized to multi-character tokens
+
+    Compiled form:
+    - One regex alternation of every token, longest first, so "<!--" wins
+      over "<" and the scan between tokens runs inside the regex engine (C)
+      instead of a Python loop over every character
+    - kinds: token → (OPEN, pairId) / (CLOSE, pairId) / (OPAQUE, closeToken)
+      / (STRAY, None)
+    - Opaque pairs (quotes, comments) jump straight to their closing token
+      with str.find, so brackets inside them are ignored
+    - A distinct opaque closer ("-->") is a token too: inside a span it is
+      consumed by the find, so the scanner only ever sees it as a stray
+    """
+
+    def __init__(self, pairs: Tuple[Tuple[str, str], ...], opaque: Tuple[Tuple[str, str], ...]):
+        self.pairs = pairs
+        self.opaque = opaque
+        self.kinds = {}
+        for pairId, (opener, closer) in enumerate(pairs):
+            if opener == closer:
+                raise ValueError(f"nesting pair {opener!r} needs distinct open/close tokens (use opaque)")
+            self.define(opener, (OPEN, pairId))
+            self.define(closer, (CLOSE, pairId))
+        for opener, closer in opaque:
+            self.define(opener, (OPAQUE, closer))
+            if closer != opener:  # Quotes close with their opener; that's never stray
+                self.define(closer, (STRAY, None))
+        if not self.kinds:
+            raise ValueError("a delimiter spec needs at least one pair")
+        tokens = sorted(self.kinds, key=len, reverse=True)  # Longest match first
+        self.tokenRe = re.compile('|'.join(map(re.escape, tokens)))
+
+    def define(self, token: str, kind: tuple) -> None:
+        """Register a token, rejecting specs where one token has two meanings."""
+        if not token:
+            raise ValueError("delimiter tokens must be non-empty")
+        if self.kinds.setdefault(token, kind) != kind:
+            raise ValueError(f"token {token!r} is used for more than one delimiter")
+
+    def isValid(self, s: str) -> bool:
+        """
+        Check that every nesting pair is balanced and every opaque span is closed.
+
+        Time Complexity: O(n) - regex scan plus O(1) work per token
+        Space Complexity: O(d) - d = max nesting depth
+
+        Args:
+            s: str - arbitrary text; anything that isn't a token is skipped
+
+        Returns:
+            bool - True if all delimiters are properly matched and nested
+        """
+        stack = []  # pairIds of currently open nesting delimiters
+        search = self.tokenRe.search
+        kinds = self.kinds
+        pos = 0
+        while True:
+            m = search(s, pos)
+            if m is None:
+                break
+            kind, arg = kinds[m.group()]
+            pos = m.end()
+            if kind == OPEN:
+                stack.append(arg)
+            elif kind == CLOSE:
+                if not stack or stack.pop() != arg:  # No opener, or wrong one
+                    return False
+            elif kind == STRAY:  # Opaque closer with no span open
+                return False
+            else:  # OPAQUE: skip to the closing token, ignoring everything inside
+                end = s.find(arg, pos)
+                if end < 0:
+                    return False  # Unterminated quote/comment
+                pos = end + len(arg)
+        return not stack
+
+
+@lru_cache(maxsize=128)
+def compileSpec(pairs: Tuple[Tuple[str, str], ...], opaque: Tuple[Tuple[str, str], ...] = ()) -> Validator:
+    """
+    Compile a (hashable) delimiter spec, reusing the result for repeat specs.
+
+    The LRU cache means building the regex and table happens once per spec,
+    no matter how many times a caller asks for it.
+    """
+    return Validator(pairs, opaque)
+
+
+def makeValidator(pairs: Iterable[Sequence[str]], opaque: Iterable[Sequence[str]] = ()) -> Validator:
+    """
+    Build (or fetch from cache) a validator for a custom delimiter set.
+
+    Args:
+        pairs: nesting delimiters as (open, close), e.g. [("(", ")"), ("<!--", "-->")]
+            or 2-character strings like "()"
+        opaque: delimiters whose contents are not parsed, e.g. [('"', '"')]
+
+    Returns:
+        Validator - call .isValid(s) on it as often as needed
+
+    Example:
+        html = makeValidator([("<div>", "</div>")], opaque=[("<!--", "-->")])
+        html.isValid("<div><!-- </div> --></div>")  → True
+    """
+    return compileSpec(tuple(tuple(p) for p in pairs), tuple(tuple(p) for p in opaque))
+
+
+class Solution:
+    def isValid(self, s: str) -> bool:
+        """
+        Determine if a string of brackets is valid using a compiled delimiter spec.
+
+        Problem: LeetCode 20 - Valid Parentheses
+        Pattern: Stack + Hashmap (compiled once, cached across calls)
+
+        Time Complexity: O(n)
+        Space Complexity: O(n) worst case for the stack
+        """
+        return makeValidator(("()", "[]", "{}")).isValid(s)
+
+
+if __name__ == "__main__":
+    # Test case 1: Simple valid pair
+    solver = Solution()
+    s1 = "()"
+    output1 = solver.isValid(s=s1)
+    print(output1)  # Expected: True
+
+    # Test case 2: Multiple valid pairs in sequence
+    solver = Solution()
+    s2 = "()[]{}"
+    output2 = solver.isValid(s=s2)
+    print(output2)  # Expected: True
+
+    # Test case 3: Mismatched bracket types
+    solver = Solution()
+    s3 = "(]"
+    output3 = solver.isValid(s=s3)
+    print(output3)  # Expected: False
+
+    # Test case 4: Properly nested brackets
+    solver = Solution()
+    s4 = "([])"
+    output4 = solver.isValid(s=s4)
+    print(output4)  # Expected: True
+
+    # Test case 5: Invalid nesting - brackets interleaved incorrectly
+    solver = Solution()
+    s5 = "([)]"
+    output5 = solver.isValid(s=s5)
+    print(output5)  # Expected: False
+
+    # Test case 6: Custom spec with multi-character tokens and quotes
+    v = makeValidator([("(", ")"), ("<!--", "-->")], opaque=[('"', '"')])
+    print(v.isValid('<!-- (a "b)" c) -->'))  # Expected: True - ')' inside quotes ignored
+    print(v.isValid('<!-- ( -->)'))  # Expected: False - comment closed while '(' open
+    print(v is makeValidator([("(", ")"), ("<!--", "-->")], opaque=[('"', '"')]))  # Expected: True (cached)
@@ -0,0 +1,166 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
+import os
+
+OPEN = 1  # Marker for opening brackets in TABLE
+
+# 256-entry lookup table (same layout as v6): 0 = not a bracket,
+# OPEN = opening bracket, otherwise the byte of the matching opener
+TABLE = bytearray(256)
+for opener, closer in (b'()', b'[]', b'{}'):
+    TABLE[opener] = OPEN
+    TABLE[closer] = opener
+
+
+def validateChunk(items: List[Union[str, bytes]]) -> bytearray:
+    """
+    Validate a list of bracket strings, returning one result byte per item.
+
+    All per-call setup (table lookup, stack allocation, bound methods) happens
+    once for the whole chunk instead of once per string.
+
+    Time Complexity: O(total length of all items)
+    Space Complexity: O(longest item) - a single stack buffer is reused
+
+    Returns:
+        bytearray - results[i] is 1 if items[i] is valid, else 0
+    """
+    table = TABLE
+    stack = bytearray()  # Reused for every item
+    push = stack.append
+    pop = stack.pop
+    results = bytearray(len(items))  # Preallocated, all 0 (= invalid)
+
+    for i, s in enumerate(items):
+        data = s.encode() if isinstance(s, str) else s
+        if len(data) % 2:  # Odd length: can't be valid
+            continue
+        del stack[:]  # Reset the shared stack (keeps its allocation)
+        ok = True
+        for b in data:
+            t = table[b]
+            if t == OPEN:
+                push(b)
+            elif t == 0 or not stack or pop() != t:  # Junk byte, no opener, or wrong opener
+                ok = False
+                break
+        if ok and not stack:
+            results[i] = 1
+    return results
+
+
+def batches(source: Union[Iterable, str, os.PathLike], size: int) -> Iterator[list]:
+    """
+    Yield lists of up to `size` strings from an iterable or a newline-delimited file.
+
+    A bare str is a file path - iterating it would yield single characters.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            lines = (line.rstrip(b'\r\n') for line in f)  # Drop the line terminator
+            yield from batches(lines, size)
+        return
+    it = iter(source)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+class Solution:
+    def isValid(self, s: str) -> bool:
+        """
+        Determine if a single string of brackets is valid (batch of one).
+
+        Problem: LeetCode 20 - Valid Parentheses
+        """
+        return validateChunk([s])[0] == 1
+
+    def isValidBatch(self, strings: Union[Iterable, str, os.PathLike], workers: Optional[int] = None,
+                     chunkSize: int = 65536) -> bytearray:
+        """
+        Validate many bracket strings in one call.
+
+        Problem: LeetCode 20 - Valid Parentheses (millions of short strings)
+        Pattern: Batching - amortize per-call overhead across many items
+
+        Approach:
+        - Calling Solution().isValid(s) per string pays for a Python call, a
+          new Solution object, a new dict and a new stack list EACH time
+        - Here the input is cut into chunks; each chunk is handled by one
+          validateChunk() call that reuses a single stack buffer and writes
+          one byte per result into a preallocated bytearray
+        - With workers > 1, chunks are spread over a process pool with at
+          most 2 * workers chunks in flight; results are appended in input
+          order as they complete, so the input is streamed, never loaded whole
+
+        Time Complexity: O(total input length)
+        Space Complexity: O(number of items) for the results (1 byte each),
+            plus O(chunkSize * workers) of input in flight
+
+        Args:
+            strings: list/iterator of str or bytes, or a path (str or
+                os.PathLike) to a newline-delimited file with one string per line
+            workers: int or None - None/1 runs in-process, otherwise the
+                number of worker processes
+            chunkSize: int - items per chunk (per task when using workers)
+
+        Returns:
+            bytearray - results[i] is 1 if the i-th string is valid, else 0
+        """
+        chunks = batches(strings, chunkSize)
+        if not workers or workers == 1:
+            results = bytearray()
+            for chunk in chunks:
+                results += validateChunk(chunk)
+            return results
+        results = bytearray()
+        pending = deque()  # Submitted chunks, oldest first
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in chunks:
+                if len(pending) >= 2 * workers:  # Window full: wait for the oldest
+                    results += pending.popleft().result()
+                pending.append(pool.submit(validateChunk, chunk))
+            while pending:
+                results += pending.popleft().result()
+        return results
+
+
+if __name__ == "__main__":
+    # Test case 1: Simple valid pair
+    solver = Solution()
+    s1 = "()"
+    output1 = solver.isValid(s=s1)
+    print(output1)  # Expected: True
+
+    # Test case 2: Multiple valid pairs in sequence
+    solver = Solution()
+    s2 = "()[]{}"
+    output2 = solver.isValid(s=s2)
+    print(output2)  # Expected: True
+
+    # Test case 3: Mismatched bracket types
+    solver = Solution()
+    s3 = "(]"
+    output3 = solver.isValid(s=s3)
+    print(output3)  # Expected: False
+
+    # Test case 4: Properly nested brackets
+    solver = Solution()
+    s4 = "([])"
+    output4 = solver.isValid(s=s4)
+    print(output4)  # Expected: True
+
+    # Test case 5: Invalid nesting - brackets interleaved incorrectly
+    solver = Solution()
+    s5 = "([)]"
+    output5 = solver.isValid(s=s5)
+    print(output5)  # Expected: False
+
+    # Test case 6: The five cases above as one batch, in-process and with a pool
+    batch = [s1, s2, s3, s4, s5]
+    print(list(solver.isValidBatch(batch)))  # Expected: [1, 1, 0, 1, 0]
+    print(list(solver.isValidBatch(batch, workers=2, chunkSize=2)))  # Expected: [1, 1, 0, 1, 0]
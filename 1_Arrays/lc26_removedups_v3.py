@@ -0,0 +1,75 @@
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - lists use the two-pointer path
+    np = None
+
+class Solution:
+    def removeDuplicates(self, nums: List[int]) -> int:
+        """
+        Remove duplicates from a sorted array in-place, vectorized for NumPy arrays.
+
+        Problem: LeetCode 26 - Remove Duplicates from Sorted Array
+        Pattern: Two Pointers / Adjacent-Difference Mask
+
+        Approach (NumPy array input):
+        - In a sorted array, an element is the first of its run exactly when it
+          differs from the element before it
+        - keep[0] = True, keep[1:] = nums[1:] != nums[:-1] - one vectorized
+          comparison over the whole array instead of a Python loop
+        - nums[keep] gathers the unique values (in sorted order), and they are
+          written back to the front of nums, just like the two-pointer version
+
+        Approach (list input):
+        - Fall back to the same two-pointer loop as v2
+
+        Time Complexity: O(n) - a handful of C-level passes for NumPy input
+        Space Complexity: O(n) for the mask and gathered values (NumPy path),
+            O(1) for the two-pointer path
+
+        Args:
+            nums: List[int] or np.ndarray - sorted in non-decreasing order
+
+        Returns:
+            int - number of unique elements (k)
+
+        Note:
+            The first k elements of nums will contain unique values in sorted order.
+        """
+        if np is not None and isinstance(nums, np.ndarray):
+            n = len(nums)
+            if n == 0:
+                return 0
+            keep = np.empty(n, dtype=bool)
+            keep[0] = True  # The first element always starts a run
+            np.not_equal(nums[1:], nums[:-1], out=keep[1:])  # Start of each new run
+            unique = nums[keep]
+            nums[:len(unique)] = unique  # Compact into the front, in place
+            return len(unique)
+
+        i = 0 # Slow pointer: tracks the position of the last unique element
+        for j in range(1, len(nums)): # Fast pointer scans the rest
+            if nums[i] != nums[j]: # New value found, place it right after the last unique one
+                i += 1
+                nums[i] = nums[j]
+        return i + 1 if nums else 0
+
+
+if __name__ == "__main__":
+    # Test case 1: Simple case with one duplicate
+    solver = Solution()
+    nums1 = [1, 1, 2]
+    output1 = solver.removeDuplicates(nums=nums1)
+    print(output1) # Expected: 2, nums1 = [1, 2, _]
+
+    # Test case 2: Multiple duplicates of various numbers
+    nums2 = [0,0,1,1,1,2,2,3,3,4]
+    output2 = solver.removeDuplicates(nums=nums2)
+    print(output2) # Expected: 5, nums2 = [0, 1, 2, 3, 4, _, _, _, _, _]
+
+    # Test case 3: Same input as a NumPy array (vectorized path)
+    if np is not None:
+        nums3 = np.array([0,0,1,1,1,2,2,3,3,4])
+        output3 = solver.removeDuplicates(nums=nums3)
+        print(output3, nums3[:output3]) # Expected: 5 [0 1 2 3 4]
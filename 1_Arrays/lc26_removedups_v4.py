@@ -0,0 +1,119 @@
+from array import array
+from typing import Callable, Iterable, Iterator, List
+import os
+import tempfile
+
+NO_VALUE = object()  # Sentinel for "no previous value yet"
+
+
+def readNumbers(path: str, parse: Callable = int) -> Iterator:
+    """
+    Lazily yield numbers from a text file (whitespace or newline separated).
+
+    Reads line by line, so memory use doesn't depend on file size.
+    """
+    with open(path) as f:
+        for line in f:
+            for token in line.split():
+                yield parse(token)
+
+
+def readBinary(path: str, typecode: str = 'q', chunkItems: int = 1 << 16) -> Iterator:
+    """
+    Lazily yield fixed-width numbers from a raw binary file, chunk by chunk.
+
+    Args:
+        path: str - file of packed native-endian values (e.g. written by array.tofile)
+        typecode: str - array.array typecode of the values
+        chunkItems: int - values read per chunk (bounds memory use)
+    """
+    itemsize = array(typecode).itemsize
+    with open(path, 'rb') as f:
+        while True:
+            chunk = array(typecode)
+            chunk.frombytes(f.read(chunkItems * itemsize))  # Short read at EOF is fine
+            if not chunk:
+                return
+            yield from chunk
+
+
+class Solution:
+    def dedupStream(self, stream: Iterable, counts: bool = False) -> Iterator:
+        """
+        Lazily yield the unique values of a sorted stream.
+
+        Problem: LeetCode 26 - Remove Duplicates from Sorted Array (streaming)
+        Pattern: Two Pointers, where the "slow pointer" is just the last value seen
+
+        Approach:
+        - In sorted input, duplicates are always adjacent
+        - So the only state needed is the previous value: emit a value when it
+          differs from the previous one
+        - With counts=True, emit (value, runLength) when each run ENDS instead,
+          which is a run-length encoding of the stream
+
+        Time Complexity: O(n) - single pass
+        Space Complexity: O(1) - only the previous value and a counter,
+            regardless of how big the stream is
+
+        Args:
+            stream: any sorted iterable (list, generator, readNumbers(),
+                readBinary(), ...)
+            counts: bool - yield (value, count) pairs instead of values
+
+        Yields:
+            unique values in sorted order, or (value, count) pairs
+        """
+        prev = NO_VALUE
+        run = 0
+        for val in stream:
+            if val == prev:
+                run += 1
+                continue
+            if prev is not NO_VALUE and counts:  # A run just ended
+                yield prev, run
+            elif not counts:
+                yield val  # Emit as soon as a new value starts
+            prev, run = val, 1
+        if counts and prev is not NO_VALUE:  # Flush the final run
+            yield prev, run
+
+    def removeDuplicates(self, nums: List[int]) -> int:
+        """
+        LeetCode signature: write the streamed unique values back into nums.
+
+        Safe in place because the write position never passes the read
+        position (there are never more unique values than values read).
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        k = 0 # Write position
+        for val in self.dedupStream(nums):
+            nums[k] = val
+            k += 1
+        return k
+
+
+if __name__ == "__main__":
+    # Test case 1: Simple case with one duplicate
+    solver = Solution()
+    nums1 = [1, 1, 2]
+    output1 = solver.removeDuplicates(nums=nums1)
+    print(output1) # Expected: 2, nums1 = [1, 2, _]
+
+    # Test case 2: Multiple duplicates of various numbers
+    nums2 = [0,0,1,1,1,2,2,3,3,4]
+    output2 = solver.removeDuplicates(nums=nums2)
+    print(output2) # Expected: 5, nums2 = [0, 1, 2, 3, 4, _, _, _, _, _]
+
+    # Test case 3: Lazily from a generator, with run lengths
+    print(list(solver.dedupStream((x // 3 for x in range(10)), counts=True)))
+    # Expected: [(0, 3), (1, 3), (2, 3), (3, 1)]
+
+    # Test case 4: From a binary file, chunk by chunk
+    with tempfile.TemporaryDirectory() as tmp:  # Cleaned up even if something raises
+        path = os.path.join(tmp, "dedup_demo.bin")
+        with open(path, 'wb') as f:
+            array('q', [5, 5, 6, 7, 7, 7]).tofile(f)
+        print(list(solver.dedupStream(readBinary(path, chunkItems=2)))) # Expected: [5, 6, 7]
@@ -0,0 +1,143 @@
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - lists always use the pointer loops
+    np = None
+
+class Solution:
+    def removeElement(self, nums: List[int], val: int) -> int:
+        """
+        LeetCode 27 signature: remove every occurrence of val (order may change).
+
+        Uses the unstable swap-with-end strategy, which writes only once per
+        removed element instead of once per kept element.
+        """
+        k, _ = self.removeMatching(nums, values=(val,), stable=False)
+        return k
+
+    def removeMatching(self, nums, values: Iterable = (), predicate: Optional[Callable] = None,
+                       mask: Optional[Sequence[bool]] = None, stable: bool = True) -> Tuple[int, int]:
+        """
+        Remove, in place, every element that is in `values`, matches `predicate`,
+        or is flagged in `mask`.
+
+        Problem: LeetCode 27 - Remove Element (generalized)
+        Pattern: Two Pointers (stable) / Swap With End (unstable) / Boolean Mask (NumPy)
+
+        Approach - stable (keeps relative order, like v1):
+        - Read pointer j scans everything, write pointer i receives each kept element
+        - Every kept element after the first removal is written once
+
+        Approach - unstable (order may change):
+        - Scan from the front; when element i must go, overwrite it with the
+          LAST element and shrink the array by one (don't advance i - the
+          moved-in element still needs checking)
+        - Writes happen only per REMOVED element, so removing a few values
+          from a big array touches very little memory
+
+        Approach - NumPy arrays:
+        - Build the removal mask in one vectorized step (np.isin, the
+          predicate applied to the whole array, or the given mask)
+        - stable: nums[~mask] gathers survivors, copy them to the front
+        - unstable: fill only the holes inside the first k slots with the
+          survivors found after slot k (at most one write per removed element)
+
+        Time Complexity: O(n)
+        Space Complexity: O(len(values)) for the lookup set, O(n) for the
+            NumPy mask
+
+        Args:
+            nums: list or np.ndarray - modified in place
+            values: iterable of values to remove (hashable)
+            predicate: function x -> bool; for NumPy input it receives the
+                whole array and must return a boolean array
+            mask: sequence of bool, True = remove that position
+            stable: keep the relative order of remaining elements
+
+        Returns:
+            (k, moves) - k = number of remaining elements (they occupy nums[:k]),
+            moves = how many elements were written to a new position
+        """
+        values = frozenset(values)
+
+        if np is not None and isinstance(nums, np.ndarray):
+            remove = np.zeros(len(nums), dtype=bool)
+            if values:
+                remove |= np.isin(nums, list(values))
+            if predicate is not None:
+                remove |= np.asarray(predicate(nums), dtype=bool)
+            if mask is not None:
+                remove |= np.asarray(mask, dtype=bool)
+            keep = ~remove
+            k = int(np.count_nonzero(keep))
+            if stable:
+                positions = np.flatnonzero(keep)
+                moves = int(np.count_nonzero(positions != np.arange(k)))  # Survivors that shift left
+                nums[:k] = nums[positions]
+            else:
+                holes = np.flatnonzero(remove[:k])  # Removed slots inside the final range
+                fillers = np.flatnonzero(keep[k:]) + k  # Survivors beyond it (same count)
+                nums[holes] = nums[fillers]
+                moves = len(holes)
+            return k, moves
+
+        def removed(idx, x):
+            return x in values or (predicate is not None and predicate(x)) or (mask is not None and mask[idx])
+
+        moves = 0
+        if stable:
+            i = 0 # Write position
+            for j in range(len(nums)): # Read position
+                if not removed(j, nums[j]):
+                    if i != j:
+                        nums[i] = nums[j]
+                        moves += 1
+                    i += 1
+            return i, moves
+
+        # Unstable: track original positions so the mask still lines up after swaps
+        origin = list(range(len(nums))) if mask is not None else None
+        i, n = 0, len(nums)
+        while i < n:
+            if removed(origin[i] if origin is not None else i, nums[i]):
+                n -= 1 # Shrink from the end
+                if i != n:
+                    nums[i] = nums[n] # Pull the last element into the hole
+                    if origin is not None:
+                        origin[i] = origin[n]
+                    moves += 1
+            else:
+                i += 1
+        return n, moves
+
+
+if __name__ == "__main__":
+    # Test case 1: Remove all 3s from array
+    solver = Solution()
+    nums1 = [3,2,2,3]
+    val1 = 3
+    output1 = solver.removeElement(nums=nums1, val=val1)
+    print(output1) # Expected: 2, nums1 = [2, 2, _, _]
+
+    # Test case 2: Remove all 2s from array with multiple occurrences
+    solver = Solution()
+    nums2 = [0,1,2,2,3,0,4,2]
+    val2 = 2
+    output2 = solver.removeElement(nums=nums2, val=val2)
+    print(output2) # Expected: 5, nums2 = [0, 1, 4, 0, 3, _, _, _] (order may vary)
+
+    # Test case 3: Remove a set of values
+    nums3 = [0,1,2,2,3,0,4,2]
+    k3, _ = solver.removeMatching(nums3, values={0, 2})
+    print(nums3[:k3]) # Expected: [1, 3, 4]
+
+    # Test case 4: Stable vs unstable write counts when removing a single early element
+    nums4 = [4,1,2,2,3,0,5,2]
+    print(solver.removeMatching(list(nums4), values={4})) # Expected: (7, 7) - everything shifts left
+    print(solver.removeMatching(list(nums4), values={4}, stable=False)) # Expected: (7, 1) - one swap
+
+    # Test case 5: Predicate - remove odd numbers, keep order
+    nums5 = [1,2,3,4,5,6]
+    k5, _ = solver.removeMatching(nums5, predicate=lambda x: x % 2)
+    print(nums5[:k5]) # Expected: [2, 4, 6]
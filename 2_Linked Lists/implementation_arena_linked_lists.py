@@ -0,0 +1,291 @@
+"""
+Arena-Backed Doubly Linked List Implementation
+
+Pattern: Linked List stored in Parallel Arrays (Arena / Pool Allocation)
+Concept: Integer Handles instead of Object Pointers
+
+Why Not One Object per Node:
+- implementation_doubly_linked_lists.py allocates a ListNode per value:
+  object header + 3 pointer fields (56 bytes with __slots__), plus the boxed
+  value itself
+- Every node is a container object the garbage collector must track and
+  traverse - millions of nodes make each full GC pass slow
+
+Key Idea:
+- Keep all nodes in three parallel typed arrays (the "arena"):
+      vals[h]  - value of node h
+      next[h]  - handle of the node after h
+      prev[h]  - handle of the node before h
+- A node is just an integer index (a HANDLE) into these arrays - "pointers"
+  are plain integers
+- array.array stores raw 8-byte machine ints, so a node costs 24 bytes
+  and the whole list is three objects the GC never has to look inside
+
+Dummy Head AND Tail Pattern (same as the object version):
+- Handle 0 is the dummy head, handle 1 is the dummy tail
+- Real nodes always live between them, so no edge cases at either end
+
+Free List for Deleted Slots:
+- A removed node's slot is pushed onto a free list, chained through the
+  same next[] array (next[h] = following free slot, NIL ends the chain)
+- The next insert pops a free slot before growing the arrays, so a list
+  that shrinks and grows again reuses its memory
+
+Structure (after insertEnd(A), insertEnd(B), insertEnd(C), removeFront()):
+    handle:  0     1     2    3    4
+    vals:    -     -     A    B    C
+    next:    3     NIL   NIL  4    1        free -> 2
+    prev:    NIL   4     -    0    3
+    list:    head(0) <-> B(3) <-> C(4) <-> tail(1)
+
+Operations Time Complexity:
+- insertFront(), insertEnd(): O(1) amortized - pop a free slot or append
+- removeFront(), removeEnd(): O(1)
+- remove(index): O(n) - must traverse to index
+- Access by position: O(n) - still need to traverse
+
+Space Complexity: O(n) - 3 machine words per node, no per-node objects
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from array import array
+
+from list_nodes import DoublyListNode
+
+NIL = -1  # "null pointer" handle
+HEAD = 0  # Dummy head handle
+TAIL = 1  # Dummy tail handle
+
+
+class ArenaLinkedList:
+    """
+    A doubly linked list whose nodes live in parallel typed arrays.
+
+    Values must fit the array typecode (signed 64-bit ints by default).
+    """
+
+    def __init__(self, typecode='q'):
+        """
+        Initialize an empty list: just the dummy head and tail slots.
+
+        Args:
+            typecode: str - array.array typecode for the stored values
+
+        Structure after initialization:
+            head(0) <-> tail(1)
+        """
+        self.vals = array(typecode, [0, 0])  # Dummy slots hold placeholder values
+        self.next = array('q', [TAIL, NIL])  # Head points forward to tail
+        self.prev = array('q', [NIL, HEAD])  # Tail points backward to head
+        self.free = NIL  # First reusable slot (chained through next[])
+        self.size = 0  # Number of real nodes
+
+    def __len__(self):
+        return self.size
+
+    def allocate(self, val):
+        """
+        Get a slot for a new node: reuse a freed one, else grow the arrays.
+
+        Time Complexity: O(1) amortized
+
+        Returns:
+            int - handle of the new (unlinked) node
+        """
+        handle = self.free
+        if handle != NIL:  # Pop from the free list
+            self.free = self.next[handle]
+            self.vals[handle] = val
+        else:  # No free slot: append one to every array
+            handle = len(self.vals)
+            self.vals.append(val)
+            self.next.append(NIL)
+            self.prev.append(NIL)
+        return handle
+
+    def release(self, handle):
+        """
+        Push a removed node's slot onto the free list.
+
+        Time Complexity: O(1)
+        """
+        self.next[handle] = self.free
+        self.free = handle
+
+    def insertBetween(self, val, before, after):
+        """
+        Link a new node between two adjacent handles.
+
+        Time Complexity: O(1) amortized
+
+        Returns:
+            int - handle of the new node
+        """
+        handle = self.allocate(val)
+        self.prev[handle] = before
+        self.next[handle] = after
+        self.next[before] = handle
+        self.prev[after] = handle
+        self.size += 1
+        return handle
+
+    def unlink(self, handle):
+        """
+        Unlink a real node and free its slot.
+
+        Time Complexity: O(1)
+
+        Returns:
+            The removed node's value
+        """
+        before, after = self.prev[handle], self.next[handle]
+        self.next[before] = after  # Previous node skips the removed one
+        self.prev[after] = before  # Next node points back past it
+        self.size -= 1
+        self.release(handle)
+        return self.vals[handle]
+
+    def insertFront(self, val):
+        """
+        Insert a new node at the front of the list (after dummy head).
+
+        Time Complexity: O(1) amortized
+
+        Returns:
+            int - handle of the new node
+        """
+        return self.insertBetween(val, HEAD, self.next[HEAD])
+
+    def insertEnd(self, val):
+        """
+        Insert a new node at the end of the list (before dummy tail).
+
+        Time Complexity: O(1) amortized
+
+        Returns:
+            int - handle of the new node
+        """
+        return self.insertBetween(val, self.prev[TAIL], TAIL)
+
+    def removeFront(self):
+        """
+        Remove the first real node (after dummy head).
+
+        Time Complexity: O(1)
+
+        Returns:
+            The removed value, or None if the list is empty
+        """
+        if not self.size:
+            return None
+        return self.unlink(self.next[HEAD])
+
+    def removeEnd(self):
+        """
+        Remove the last real node (before dummy tail).
+
+        Time Complexity: O(1)
+
+        Returns:
+            The removed value, or None if the list is empty
+        """
+        if not self.size:
+            return None
+        return self.unlink(self.prev[TAIL])
+
+    def remove(self, index):
+        """
+        Remove the node at the specified index (0-indexed).
+
+        Time Complexity: O(n) - walks from whichever end is closer
+
+        Returns:
+            The removed value, or None if index is out of range
+        """
+        if index < 0 or index >= self.size:
+            return None
+        if index < self.size // 2:  # Closer to the front
+            handle = self.next[HEAD]
+            for _ in range(index):
+                handle = self.next[handle]
+        else:  # Closer to the back
+            handle = self.prev[TAIL]
+            for _ in range(self.size - 1 - index):
+                handle = self.prev[handle]
+        return self.unlink(handle)
+
+    def __iter__(self):
+        """
+        Yield values from front to back.
+        """
+        handle = self.next[HEAD]
+        while handle != TAIL:
+            yield self.vals[handle]
+            handle = self.next[handle]
+
+    def print(self):
+        """
+        Print all values in the list in order (forward direction).
+
+        Time Complexity: O(n) - must visit every node
+
+        Format: val1 -> val2 -> val3 ->
+        """
+        for val in self:
+            print(val, " -> ", end="")
+        print()  # Newline at end
+
+
+def benchmark(n=10**6):
+    """
+    Compare an n-node object list against the arena: memory and full-GC pause.
+
+    Building two 10^6-node lists takes ~10 s; run it with --benchmark.
+
+    Object-list memory includes the boxed int values (ints above 256 are
+    separate objects); the arena stores them unboxed.
+    """
+    def objectList():  # Same layout as implementation_doubly_linked_lists.LinkedList
+        head, tail = DoublyListNode(-1), DoublyListNode(-1)
+        head.next, tail.prev = tail, head
+        for i in range(n):
+            node = DoublyListNode(i, tail, tail.prev)
+            tail.prev.next = node
+            tail.prev = node
+        return head
+
+    def arenaList():
+        lst = ArenaLinkedList()
+        for i in range(n):
+            lst.insertEnd(i)
+        return lst
+
+    for label, build in (('DoublyListNode objects', objectList), ('ArenaLinkedList', arenaList)):
+        tracemalloc.start()
+        lst = build()
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        gc.collect()  # Every tracked object gets traversed
+        pause = time.perf_counter() - start
+        print(f"{label:<24}{used / n:6.1f} bytes per node, gc.collect() {pause * 1000:7.1f} ms")
+        del lst
+        gc.collect()  # Don't bill this list's teardown to the next one
+
+
+if __name__ == "__main__":
+    lst = ArenaLinkedList()
+    lst.insertEnd(1)
+    lst.insertEnd(2)
+    lst.insertEnd(3)
+    lst.insertFront(0)
+    lst.print()  # Expected: 0 -> 1 -> 2 -> 3 ->
+    print(lst.removeFront(), lst.removeEnd())  # Expected: 0 3
+    lst.insertEnd(4)  # Reuses the slot freed by removeEnd
+    print(lst.remove(1), list(lst), len(lst.vals))  # Expected: 2 [1, 4] 6
+
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
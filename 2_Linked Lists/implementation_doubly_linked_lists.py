@@ -50,29 +50,7 @@ Common Doubly Linked List Interview Problems:
 - Music playlist navigation
 """
 
-
-class ListNode:
-    """
-    A single node in a doubly linked list.
-    
-    Each node stores a value and references to both next and previous nodes.
-    """
-    
-    def __init__(self, val):
-        """
-        Initialize a doubly linked list node with a value.
-        
-        Args:
-            val: int - the data stored in this node
-            
-        Attributes:
-            val: int - the data value
-            next: ListNode - pointer to next node (None initially)
-            prev: ListNode - pointer to previous node (None initially)
-        """
-        self.val = val  # Data stored in this node
-        self.next = None  # Pointer to next node
-        self.prev = None  # Pointer to previous node
+from list_nodes import DoublyListNode as ListNode  # val + next + prev, with __slots__ (see list_nodes.py)
 
 
 class LinkedList:
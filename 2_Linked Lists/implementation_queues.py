@@ -35,6 +35,14 @@ Implementation Note:
 - Comment notes dummy nodes would make this easier!
 - Must handle empty queue carefully for both enqueue and dequeue
 
+Node Reuse:
+- enqueue/dequeue churn would allocate and free one node per element
+- Dequeued nodes go onto a NodePool free list and are handed back out by
+  the next enqueue, so a queue that stays around the same size stops
+  allocating altogether
+- The pool keeps at most maxFree spare nodes, so a queue that drains after
+  a burst gives the rest back instead of holding its peak size forever
+
 Operations Time Complexity:
 - enqueue(): O(1) - append to right (back)
 - dequeue(): O(1) - remove from left (front)
@@ -48,23 +56,7 @@ Why Linked List for Queue:
 - Linked list naturally supports O(1) add at back, O(1) remove from front
 """
 
-
-class ListNode:
-    """
-    A node in the queue's singly linked list.
-    
-    Each node represents one element in the queue.
-    """
-    
-    def __init__(self, val):
-        """
-        Initialize a queue node with a value.
-        
-        Args:
-            val: int - the data value stored in this node
-        """
-        self.val = val  # Data stored in this node
-        self.next = None  # Pointer to next node in queue
+from list_nodes import NodePool  # Free list of slotted ListNodes (see list_nodes.py)
 
 
 class Queue:
@@ -92,6 +84,7 @@ class Queue:
         """
         # Implementing this with dummy nodes would be easier!
         self.left = self.right = None  # Both pointers start as None (empty queue)
+        self.pool = NodePool()  # Dequeued nodes are recycled by later enqueues
     
     def enqueue(self, val):
         """
@@ -119,7 +112,7 @@ class Queue:
             enqueue(2): left -> 1 -> 2 <- right
             enqueue(3): left -> 1 -> 2 -> 3 <- right
         """
-        newNode = ListNode(val)  # Create new node with value
+        newNode = self.pool.acquire(val)  # Reuse a dequeued node, or create a new one
 
         # Queue is non-empty
         if self.right:
@@ -162,8 +155,10 @@ class Queue:
             return None  # Cannot dequeue from empty queue
         
         # Remove left node and return value
-        val = self.left.val  # Save value to return
-        self.left = self.left.next  # Move left pointer forward (remove front node)
+        front = self.left
+        val = front.val  # Save value to return
+        self.left = front.next  # Move left pointer forward (remove front node)
+        self.pool.release(front)  # Hand the old front node back for reuse
         
         # If queue is now empty, update right pointer too
         if not self.left:
@@ -39,28 +39,7 @@ Common Linked List Interview Problems:
 - Remove nth node from end
 """
 
-
-class ListNode:
-    """
-    A single node in a singly linked list.
-    
-    Each node stores a value and a reference to the next node.
-    The last node in the list has next = None.
-    """
-    
-    def __init__(self, val):
-        """
-        Initialize a list node with a value.
-        
-        Args:
-            val: int - the data stored in this node
-            
-        Attributes:
-            val: int - the data value
-            next: ListNode - pointer to the next node (None if this is the last node)
-        """
-        self.val = val  # Data stored in this node
-        self.next = None  # Pointer to next node (initially None)
+from list_nodes import ListNode  # val + next, with __slots__ (see list_nodes.py)
 
 
 class LinkedList:
@@ -7,11 +7,8 @@ and .prev can navigate back
 we will also need a pointer to track which webpage we are on
 '''
 
-class ListNode:
-    def __init__(self, url: str):
-        self.val = url
-        self.next = None
-        self.prev = None
+from list_nodes import DoublyListNode as ListNode # nodes store url's in .val
+
 
 class BrowserHistory:
 
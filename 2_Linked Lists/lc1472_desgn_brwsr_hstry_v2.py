@@ -47,24 +47,7 @@ Alternative Approaches:
 This solution uses doubly linked list for natural forward/back semantics
 """
 
-
-class ListNode:
-    """
-    A node in the browser history doubly linked list.
-    
-    Each node represents a webpage (URL) in the browsing history.
-    """
-    
-    def __init__(self, url: str):
-        """
-        Initialize a history node with a URL.
-        
-        Args:
-            url: str - the webpage URL (or None for dummy nodes)
-        """
-        self.val = url  # URL of the webpage (None for dummy head/tail)
-        self.next = None  # Pointer to next page in history (forward)
-        self.prev = None  # Pointer to previous page in history (back)
+from list_nodes import DoublyListNode as ListNode  # val (the URL) + next + prev, with __slots__ (see list_nodes.py)
 
 
 class BrowserHistory:
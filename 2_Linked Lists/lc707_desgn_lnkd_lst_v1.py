@@ -1,71 +1,86 @@
-class ListNode:
-    def __init__(self, val: int):
-        self.val = val
-        self.next = None
-        
+import time
+
+from list_nodes import DoublyListNode as ListNode # prev lets us walk backwards from the tail
+
+
 class MyLinkedList:
 
     def __init__(self):
         self.head = ListNode(-1)
-        self.tail = ListNode(-1)  
+        self.tail = ListNode(-1)
         self.head.next = self.tail
-        self.size = 0         
+        self.tail.prev = self.head # tail.prev is always the last real node (or head if empty)
+        self.size = 0
+
+    def nodeAt(self, index: int) -> ListNode:
+        # returns the node at index (-1 = head, size = tail), walking from whichever end is closer
+        if index < self.size // 2: # closer to the front
+            curr = self.head
+            for _ in range(index + 1): # head sits at position -1
+                curr = curr.next
+        else: # closer to the back
+            curr = self.tail
+            for _ in range(self.size - index): # tail sits at position size
+                curr = curr.prev
+        return curr
 
     def get(self, index: int) -> int:
-        i = 0
-        curr = self.head.next # iteration starts at first real node
-        while i < index and curr:
-            i += 1
-            curr = curr.next
-        if curr is None or curr == self.tail: # if index is out of bounds, or curr lands at tail
+        if index < 0 or index >= self.size: # if index is out of bounds
             return -1
-        else:
-            return curr.val                
+        return self.nodeAt(index).val
 
-    def addAtHead(self, val: int) -> None:
+    def insertBefore(self, succ: ListNode, val: int) -> None:
         newNode = ListNode(val)
-        newNode.next = self.head.next # pointing newnode.next to first real node
-        self.head.next = newNode # pointing head to newnode
-        self.size += 1 # each time method is called
+        newNode.prev = succ.prev # node currently before succ
+        newNode.next = succ
+        succ.prev.next = newNode
+        succ.prev = newNode
+        self.size += 1 # each time a node is added
+
+    def addAtHead(self, val: int) -> None:
+        self.insertBefore(self.head.next, val) # before first real node (or tail if empty)
 
     def addAtTail(self, val: int) -> None:
-        newNode = ListNode(val)
-        newNode.next = self.tail # newnode.next points to tail
-        curr = self.head # want to access last real node without prev pointer
-        while curr.next != self.tail: # instantly breaks if empty
-            curr = curr.next # stops at last real node
-        curr.next = newNode 
-        self.size += 1
+        self.insertBefore(self.tail, val) # O(1): no scan, tail.prev is the last real node
 
     def addAtIndex(self, index: int, val: int) -> None:
-        if index > self.size: # invalid
+        if index < 0 or index > self.size: # invalid
             return None # exit, no addition
-        if index == self.size: 
-            self.addAtTail(val)
-            return None # exit to prevent double addition
-
-        newNode = ListNode(val)
-        i = -1 # starting before index 0, in case index = 0
-        curr = self.head # iterating from before index 0, in case index = 0
-        while i < (index - 1) and curr: # want to stop at node before index
-            i += 1
-            curr = curr.next   
-        newNode.next = curr.next # pointing newnode.next to node presetly at index being shifted right
-        curr.next = newNode # point node before index to newnode
-        self.size += 1
+        self.insertBefore(self.nodeAt(index), val) # index == size lands on tail, same as addAtTail
 
     def deleteAtIndex(self, index: int) -> None:
-        if (index < 0) or (index >= self.size): # index validation, handles edge cases eg. when deleting from an empty list, or curr.next = self.tail
-            return None # exit, no deletion        
-        i = -1 
-        curr = self.head 
-        while i < (index - 1) and curr: 
-            i += 1
-            curr = curr.next   
-        curr.next = curr.next.next 
+        if (index < 0) or (index >= self.size): # index validation, handles edge cases eg. when deleting from an empty list
+            return None # exit, no deletion
+        curr = self.nodeAt(index)
+        curr.prev.next = curr.next
+        curr.next.prev = curr.prev # keeps tail.prev pointing at the last real node
         self.size -= 1
 
-        
+
+def benchmark(sizes=(10**4, 10**5, 10**6)):
+    # regression check: n appends should take O(n) total, so time per append stays flat
+    for n in sizes:
+        lst = MyLinkedList()
+        start = time.perf_counter()
+        for i in range(n):
+            lst.addAtTail(i)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>8} appends: {elapsed:.3f} s total, {elapsed / n * 1e9:.0f} ns per append")
+
+
+if __name__ == "__main__":
+    obj = MyLinkedList()
+    obj.addAtHead(1)
+    obj.addAtTail(3)
+    obj.addAtIndex(1, 2) # linked list becomes 1->2->3
+    print(obj.get(1)) # Expected: 2
+    obj.deleteAtIndex(2) # deleting the last node moves tail.prev back: 1->2
+    obj.addAtTail(4) # 1->2->4
+    print(obj.get(2)) # Expected: 4
+
+    benchmark()
+
+
 
 
 # Your MyLinkedList object will be instantiated and called as such:
@@ -74,4 +89,4 @@ class MyLinkedList:
 # obj.addAtHead(val)
 # obj.addAtTail(val)
 # obj.addAtIndex(index,val)
-# obj.deleteAtIndex(index)
\ No newline at end of file
+# obj.deleteAtIndex(index)
@@ -36,24 +36,8 @@ Space Complexity: O(1) per operation (creating/deleting single nodes)
 Overall space: O(n) where n is number of elements in list
 """
 
+from list_nodes import ListNode  # val + next, with __slots__ (see list_nodes.py)
 
-class ListNode:
-    """
-    A single node in a singly linked list.
-    
-    Contains a value and a pointer to the next node.
-    """
-    
-    def __init__(self, val: int):
-        """
-        Initialize a list node.
-        
-        Args:
-            val: int - the data value stored in this node
-        """
-        self.val = val  # Data stored in this node
-        self.next = None  # Pointer to next node (None initially)
-        
 
 class MyLinkedList:
     """
@@ -0,0 +1,225 @@
+"""
+Custom Linked List Implementation - Indexable Skip List
+
+Problem: LeetCode 707 - Design Linked List
+Pattern: Skip List with Width-Annotated Forward Pointers
+
+Why v1/v2 Are Slow:
+- get(), addAtIndex() and deleteAtIndex() all walk node by node from head
+- Each call is O(n), so 10^6-node lists spend all their time traversing
+
+Key Design Decisions:
+- Every node keeps a TOWER of forward pointers: next[0] is the ordinary
+  linked list, next[1] skips ~2 nodes, next[2] ~4 nodes, and so on
+- A node's tower height is random: height h with probability 1/2^h, so
+  about half the nodes reach level 1, a quarter reach level 2, ...
+- Each pointer also stores its WIDTH = how many level-0 steps it jumps over
+- To reach index i: start at the top level of the dummy head, take every
+  jump that doesn't overshoot i, then drop a level - like binary search
+  over a linked list
+- Insert/delete fix up next AND width on each level at the split point
+
+Structure (widths in parentheses):
+    level 2: head ---------------(4)--------------> D
+    level 1: head -----(2)-----> B -----(2)-----> D
+    level 0: head -(1)-> A -(1)-> B -(1)-> C -(1)-> D
+
+Operations Time Complexity (expected):
+- get(index): O(log n)
+- addAtHead(val), addAtTail(val), addAtIndex(index, val): O(log n)
+- deleteAtIndex(index): O(log n)
+
+Space Complexity: O(n) expected - on average 2 pointers + 2 widths per node
+"""
+
+import random
+import sys
+import time
+
+MAX_LEVEL = 32  # Enough for 2^32 elements
+
+
+class SkipNode:
+    """
+    A skip list node: a value plus a tower of (next, width) pairs.
+    """
+
+    __slots__ = ('val', 'next', 'width')
+
+    def __init__(self, val: int, level: int):
+        """
+        Args:
+            val: int - the data value stored in this node
+            level: int - tower height (number of forward pointers)
+        """
+        self.val = val  # Data stored in this node
+        self.next = [None] * level  # next[lvl]: following node on level lvl
+        self.width = [1] * level  # width[lvl]: positions jumped by next[lvl]
+
+
+class MyLinkedList:
+    """
+    LeetCode 707 API backed by an indexable skip list.
+
+    Positions are 0-indexed; the dummy head sits at position -1.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty list: a dummy head with a full-height tower.
+        """
+        self.head = SkipNode(-1, MAX_LEVEL)  # Dummy head sentinel
+        self.level = 1  # Levels currently in use
+        self.size = 0  # Number of real nodes
+
+    def randomLevel(self) -> int:
+        """
+        Pick a tower height: 1 + number of consecutive coin flips that land heads.
+        """
+        level = 1
+        while level < MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def get(self, index: int) -> int:
+        """
+        Get the value at index by taking the widest jumps that don't overshoot.
+
+        Time Complexity: O(log n) expected
+
+        Returns:
+            int - value at index, or -1 if index is invalid
+        """
+        if index < 0 or index >= self.size:
+            return -1
+        node, pos = self.head, -1
+        for lvl in reversed(range(self.level)):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= index:
+                pos += node.width[lvl]  # Jump forward
+                node = node.next[lvl]
+        return node.val  # pos == index here
+
+    def addAtHead(self, val: int) -> None:
+        self.addAtIndex(0, val)
+
+    def addAtTail(self, val: int) -> None:
+        self.addAtIndex(self.size, val)
+
+    def addAtIndex(self, index: int, val: int) -> None:
+        """
+        Insert val so it ends up at position index.
+
+        Time Complexity: O(log n) expected
+
+        Strategy:
+            On every level, stop at the last node BEFORE the insertion point.
+            - Levels the new node reaches: splice it in and split the width
+            - Higher levels: the jump now passes over one more node, width + 1
+        """
+        if index < 0 or index > self.size:  # invalid
+            return None
+
+        newLevel = self.randomLevel()
+        self.level = max(self.level, newLevel)
+        newNode = SkipNode(val, newLevel)
+
+        node, pos = self.head, -1
+        for lvl in reversed(range(self.level)):
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            if lvl < newLevel:  # Splice newNode in after node on this level
+                offset = index - pos  # node → newNode distance
+                newNode.next[lvl] = node.next[lvl]
+                newNode.width[lvl] = node.width[lvl] - offset + 1  # newNode → old next
+                node.next[lvl] = newNode
+                node.width[lvl] = offset
+            else:
+                node.width[lvl] += 1  # This jump now spans the new node too
+        self.size += 1
+
+    def deleteAtIndex(self, index: int) -> None:
+        """
+        Delete the node at index.
+
+        Time Complexity: O(log n) expected
+
+        Strategy:
+            On every level, stop at the last node BEFORE index.
+            - If its next IS the target: bypass it and merge the two widths
+            - Otherwise: the jump passes over one fewer node, width - 1
+        """
+        if index < 0 or index >= self.size:  # index validation
+            return None
+
+        node, pos = self.head, -1
+        for lvl in reversed(range(self.level)):
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            target = node.next[lvl]
+            if target is not None and pos + node.width[lvl] == index:  # Target is on this level
+                node.next[lvl] = target.next[lvl]
+                node.width[lvl] += target.width[lvl] - 1
+            else:
+                node.width[lvl] -= 1
+        self.size -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:  # Drop empty top levels
+            self.level -= 1
+
+
+def benchmark(sizes=(10**3, 10**4, 10**5, 10**6), ops=100):
+    """
+    Time random get/addAtIndex/deleteAtIndex calls on v1, v2 and this skip list.
+
+    The 10^6-node O(n) walks in v1/v2 take ~40 s, so the demo below only
+    runs this with: python lc707_desgn_lnkd_lst_v3.py --benchmark
+
+    Lists are pre-filled with addAtHead (O(1) in every version, so the fill
+    itself doesn't dominate), then `ops` rounds of the three index operations
+    are timed at random positions.
+    """
+    import importlib
+    versions = {
+        'v1': importlib.import_module('lc707_desgn_lnkd_lst_v1').MyLinkedList,
+        'v2': importlib.import_module('lc707_desgn_lnkd_lst_v2').MyLinkedList,
+        'v3': MyLinkedList,
+    }
+    print(f"{'nodes':>9} " + " ".join(f"{name + ' (s)':>10}" for name in versions))
+    for n in sizes:
+        rng = random.Random(n)
+        indices = [rng.randrange(n) for _ in range(ops)]
+        timings = []
+        for cls in versions.values():
+            lst = cls()
+            for i in range(n):
+                lst.addAtHead(i)
+            start = time.perf_counter()
+            for i in indices:
+                lst.get(i)
+                lst.addAtIndex(i, -i)
+                lst.deleteAtIndex(i)
+            timings.append(time.perf_counter() - start)
+        print(f"{n:>9} " + " ".join(f"{t:>10.4f}" for t in timings))
+
+
+if __name__ == "__main__":
+    obj = MyLinkedList()
+    obj.addAtHead(1)
+    obj.addAtTail(3)
+    obj.addAtIndex(1, 2)  # linked list becomes 1->2->3
+    print(obj.get(1))  # Expected: 2
+    obj.deleteAtIndex(1)  # now the linked list is 1->3
+    print(obj.get(1))  # Expected: 3
+
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+
+
+# Your MyLinkedList object will be instantiated and called as such:
+# obj = MyLinkedList()
+# param_1 = obj.get(index)
+# obj.addAtHead(val)
+# obj.addAtTail(val)
+# obj.addAtIndex(index,val)
+# obj.deleteAtIndex(index)
@@ -0,0 +1,194 @@
+"""
+Custom Linked List Implementation - Unrolled Linked List
+
+Problem: LeetCode 707 - Design Linked List
+Pattern: Unrolled Linked List (linked list of small arrays)
+
+Why Unroll:
+- v1/v2 allocate one Python object per value: even with __slots__ the
+  object header and pointer fields cost far more than the int itself
+- Walking node by node means one pointer chase (likely a cache miss)
+  per element
+- An unrolled list stores up to B values per node in a compact array, so
+  there are ~n/B nodes: per-element overhead and traversal steps both
+  shrink by roughly B
+
+Key Design Decisions:
+- Each block holds between B/2 and B values (except possibly the last one)
+- Insert into a full block → split it into two half-full blocks
+- Delete leaves a block under half full → merge with the next block if
+  both fit in one, else borrow values from the front of the next block
+  until both are at least half full (either way O(B))
+- Values live in array.array('q'): 8 bytes each, no boxed int objects
+- Dummy head block + 'last' pointer: addAtTail is O(1) amortized
+
+Structure (B = 4):
+    head -> [1 2 3] -> [4 5] -> [6 7 8 9] -> None
+                                 ^
+                                 last
+
+Operations Time Complexity:
+- get(index): O(n / B) - skip whole blocks by their length
+- addAtHead(val): O(B) - shift inside the first block
+- addAtTail(val): O(1) amortized - append to the last block
+- addAtIndex(index, val): O(n / B + B)
+- deleteAtIndex(index): O(n / B + B)
+
+Space Complexity: O(n) - about 8 bytes per value plus one node per B values
+"""
+
+from array import array
+
+
+class BlockNode:
+    """
+    One block of the unrolled list: a small typed array of values + next pointer.
+    """
+
+    __slots__ = ('vals', 'next')
+
+    def __init__(self, vals=None):
+        """
+        Args:
+            vals: array.array or None - initial contents of the block
+        """
+        self.vals = vals if vals is not None else array('q')  # Up to B values, in order
+        self.next = None  # Pointer to next block
+
+
+class MyLinkedList:
+    """
+    LeetCode 707 API backed by an unrolled linked list.
+    """
+
+    def __init__(self, blockSize: int = 64):
+        """
+        Initialize an empty list with a dummy head block.
+
+        Args:
+            blockSize: int - maximum values per block (B)
+        """
+        self.blockSize = blockSize
+        self.head = BlockNode()  # Dummy head block, always empty
+        self.last = self.head  # Last block (append target)
+        self.size = 0
+
+    def locate(self, index: int):
+        """
+        Find the block holding index.
+
+        Time Complexity: O(n / B) - one step per block, not per value
+
+        Returns:
+            (prev, block, offset) - prev is the block before `block`
+        """
+        prev, block = self.head, self.head.next
+        while index >= len(block.vals):  # Skip whole blocks
+            index -= len(block.vals)
+            prev, block = block, block.next
+        return prev, block, index
+
+    def split(self, block: BlockNode) -> None:
+        """
+        Split an overfull block into two halves.
+
+        Time Complexity: O(B)
+        """
+        half = len(block.vals) // 2
+        newBlock = BlockNode(block.vals[half:])  # Second half moves to a new block
+        del block.vals[half:]
+        newBlock.next = block.next
+        block.next = newBlock
+        if self.last is block:
+            self.last = newBlock
+
+    def get(self, index: int) -> int:
+        """
+        Get the value at index, or -1 if index is invalid.
+        """
+        if index < 0 or index >= self.size:
+            return -1
+        _, block, offset = self.locate(index)
+        return block.vals[offset]
+
+    def addAtHead(self, val: int) -> None:
+        self.addAtIndex(0, val)
+
+    def addAtTail(self, val: int) -> None:
+        """
+        Append to the last block (starting a new one if it's full).
+
+        Time Complexity: O(1) amortized
+        """
+        if self.last is self.head or len(self.last.vals) >= self.blockSize:
+            newBlock = BlockNode()  # Fresh block: the dummy head never holds values
+            self.last.next = newBlock
+            self.last = newBlock
+        self.last.vals.append(val)
+        self.size += 1
+
+    def addAtIndex(self, index: int, val: int) -> None:
+        """
+        Insert val before position index.
+
+        Time Complexity: O(n / B + B)
+        """
+        if index < 0 or index > self.size:  # invalid
+            return None
+        if index == self.size:
+            self.addAtTail(val)
+            return None
+        _, block, offset = self.locate(index)
+        block.vals.insert(offset, val)  # Shift inside one block only
+        self.size += 1
+        if len(block.vals) > self.blockSize:
+            self.split(block)
+
+    def deleteAtIndex(self, index: int) -> None:
+        """
+        Delete the value at index, then fix up a block that got too small:
+        unlink it if empty, merge it with the next block if both fit in one,
+        otherwise borrow from the next block so both stay at least half full.
+
+        Time Complexity: O(n / B + B)
+        """
+        if index < 0 or index >= self.size:  # index validation
+            return None
+        prev, block, offset = self.locate(index)
+        del block.vals[offset]
+        self.size -= 1
+
+        if not block.vals:  # Empty block: unlink it
+            prev.next = block.next
+            if self.last is block:
+                self.last = prev
+        elif len(block.vals) < self.blockSize // 2 and block.next is not None:
+            nxt = block.next
+            if len(block.vals) + len(nxt.vals) <= self.blockSize:  # Underfull: absorb the next block
+                block.vals.extend(nxt.vals)
+                block.next = nxt.next
+                if self.last is nxt:
+                    self.last = block
+            else:  # Too many to merge: borrow just enough from the next block's front
+                need = self.blockSize // 2 - len(block.vals)  # nxt keeps > B - B/2 values
+                block.vals.extend(nxt.vals[:need])
+                del nxt.vals[:need]
+
+
+if __name__ == "__main__":
+    obj = MyLinkedList(blockSize=2)
+    obj.addAtHead(1)
+    obj.addAtTail(3)
+    obj.addAtIndex(1, 2)  # linked list becomes 1->2->3 (first block splits)
+    print(obj.get(1))  # Expected: 2
+    obj.deleteAtIndex(1)  # now the linked list is 1->3
+    print(obj.get(1))  # Expected: 3
+
+
+# Your MyLinkedList object will be instantiated and called as such:
+# obj = MyLinkedList()
+# param_1 = obj.get(index)
+# obj.addAtHead(val)
+# obj.addAtTail(val)
+# obj.addAtIndex(index,val)
+# obj.deleteAtIndex(index)
@@ -0,0 +1,168 @@
+"""
+Shared Linked List Node Types
+
+Pattern: Node-based Data Structures
+Concept: Memory-Lean Nodes with __slots__ and a Free List
+
+Every linked list module in this folder builds on the same two node shapes:
+- ListNode: val + next (singly linked lists, queues, LeetCode 206/707)
+- DoublyListNode: val + next + prev (doubly linked lists, LeetCode 1472/707)
+
+Why __slots__:
+- A normal class instance stores its attributes in a per-instance __dict__
+  (a whole hash table, ~100+ bytes) on top of the object itself
+- __slots__ = ('val', 'next') tells Python the attribute names up front, so
+  it reserves fixed pointer-sized fields in the object instead - no __dict__
+- For millions of nodes this roughly halves memory (run this file to see)
+- Trade-off: you can't add new attributes to a node on the fly
+
+Why a Node Pool (Free List):
+- Structures that constantly add and remove nodes (queues, LRU caches)
+  allocate and free an object for every operation
+- NodePool keeps released nodes on a free list - itself a singly linked
+  list threaded through the nodes' own `next` pointers - and hands them
+  back out on the next acquire(), so steady-state churn allocates nothing
+- The free list is capped (maxFree): past the cap, released nodes are simply
+  dropped, so a structure that once peaked at N nodes doesn't hold N dead
+  nodes forever after it drains
+
+Operations Time Complexity:
+- NodePool.acquire(): O(1) - pop from the free list, or allocate
+- NodePool.release(): O(1) - push onto the free list
+"""
+
+import time
+import tracemalloc
+
+
+class ListNode:
+    """
+    A single node in a singly linked list.
+
+    Each node stores a value and a reference to the next node.
+    The last node in the list has next = None.
+    """
+
+    __slots__ = ('val', 'next')  # Fixed fields, no per-instance __dict__
+
+    def __init__(self, val=0, next=None):
+        """
+        Initialize a list node.
+
+        Args:
+            val: the data stored in this node
+            next: ListNode - pointer to the next node (None if this is the last node)
+        """
+        self.val = val  # Data stored in this node
+        self.next = next  # Pointer to next node
+
+
+class DoublyListNode:
+    """
+    A single node in a doubly linked list.
+
+    Each node stores a value and references to both next and previous nodes.
+    """
+
+    __slots__ = ('val', 'next', 'prev')
+
+    def __init__(self, val=0, next=None, prev=None):
+        """
+        Initialize a doubly linked list node.
+
+        Args:
+            val: the data stored in this node
+            next: DoublyListNode - pointer to next node (None initially)
+            prev: DoublyListNode - pointer to previous node (None initially)
+        """
+        self.val = val  # Data stored in this node
+        self.next = next  # Pointer to next node
+        self.prev = prev  # Pointer to previous node
+
+
+class NodePool:
+    """
+    A free list of released nodes, reused instead of allocating new ones.
+    """
+
+    def __init__(self, nodeType=ListNode, maxFree=1024):
+        """
+        Args:
+            nodeType: ListNode or DoublyListNode - the kind of node to hand out
+            maxFree: int - most nodes kept for reuse; extra releases are dropped
+        """
+        self.nodeType = nodeType
+        self.maxFree = maxFree
+        self.doubly = 'prev' in nodeType.__slots__  # Whether prev needs resetting
+        self.free = None  # Head of the free list (chained through .next)
+        self.available = 0  # Number of nodes waiting on the free list
+
+    def acquire(self, val):
+        """
+        Get a node holding val: a recycled one if available, else a new one.
+
+        Time Complexity: O(1)
+        """
+        node = self.free
+        if node is None:  # Free list empty: allocate
+            return self.nodeType(val)
+        self.free = node.next  # Pop from the free list
+        self.available -= 1
+        node.val = val
+        node.next = None
+        return node
+
+    def release(self, node) -> None:
+        """
+        Return a node that is no longer linked into any list.
+
+        Time Complexity: O(1)
+
+        If the free list is already full the node is left for the garbage
+        collector instead.
+
+        Note:
+            The caller must not keep using the node after releasing it -
+            the next acquire() may hand it out with a different value.
+        """
+        node.val = None  # Drop the reference so the value can be collected
+        if self.doubly:
+            node.prev = None
+        if self.available >= self.maxFree:  # Pool is full: let this one go
+            node.next = None
+            return
+        node.next = self.free  # Push onto the free list
+        self.free = node
+        self.available += 1
+
+
+def benchmark(n=10**6):
+    """
+    Measure bytes per node for an n-node singly linked chain, with and without __slots__.
+    """
+    class DictNode:  # The old per-module ListNode: attributes live in a __dict__
+        def __init__(self, val):
+            self.val = val
+            self.next = None
+
+    for label, nodeType in (('__dict__ node', DictNode), ('ListNode (__slots__)', ListNode),
+                            ('DoublyListNode (__slots__)', DoublyListNode)):
+        tracemalloc.start()
+        head = curr = nodeType(0)
+        for _ in range(n - 1):  # Small ints are cached, so this counts node cost only
+            curr.next = nodeType(0)
+            curr = curr.next
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<28}{used / n:6.1f} bytes per node")
+        del head, curr
+
+    pool = NodePool()
+    start = time.perf_counter()
+    for i in range(n):  # acquire/release churn reuses one node
+        pool.release(pool.acquire(i))
+    print(f"{'pooled acquire+release':<28}{(time.perf_counter() - start) / n * 1e9:6.0f} ns per pair")
+
+
+if __name__ == "__main__":
+    benchmark()